@@ -19,12 +19,13 @@ import os
 import sys
 import platform
 import logging
+import copy
+import importlib
+import importlib.util
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-# Force screen capture mode
-USE_NATIVE_API = False
-
 # Version information
 __version__ = "0.1.0"
 __author__ = "Kill_Me_I_Noobs"
@@ -33,9 +34,9 @@ __status__ = "Alpha"  # Options: "Alpha", "Beta", "Production"
 
 # Constants for the application
 APP_NAME = "PyScope"
-APP_DIR = os.path.dirname(os.path.abspath(__file__))
-RESOURCES_DIR = os.path.join(APP_DIR, "resources")
-USER_CONFIG_DIR = os.path.expanduser("~/.pyscope")
+APP_DIR = Path(__file__).resolve().parent
+RESOURCES_DIR = APP_DIR / "resources"
+USER_CONFIG_DIR = Path.home() / ".pyscope"
 
 # Create a logger for the package
 logger = logging.getLogger(__name__)
@@ -46,30 +47,59 @@ IS_WINDOWS = PLATFORM == "Windows"
 IS_MACOS = PLATFORM == "Darwin"
 IS_LINUX = PLATFORM == "Linux"
 
-# Environment variables
-USE_NATIVE_API = IS_WINDOWS and not os.environ.get("PYSCOPE_NO_NATIVE", False)
+# Environment variables (parsed once; "0"/"false" must not disable the native API)
+_TRUTHY = {"1", "true", "yes", "on"}
+_NATIVE_DISABLED = os.environ.get("PYSCOPE_NO_NATIVE", "").strip().lower() in _TRUTHY
+USE_NATIVE_API = IS_WINDOWS and not _NATIVE_DISABLED
 
 # Feature flags
 FULLSCREEN_SUPPORTED = False  # Explicitly mark fullscreen as unsupported
 
-# Create resources directory if it doesn't exist and we're in development mode
-if not os.path.exists(RESOURCES_DIR) and not getattr(sys, 'frozen', False):
+@functools.lru_cache(maxsize=1)
+def ensure_resources_dir() -> Path:
+    """
+    Create the resources directory on first use.
+    
+    Nothing is created for frozen (packaged) builds. The check runs at most
+    once per process.
+    
+    Returns:
+        Path: The resources directory
+    """
+    if not getattr(sys, 'frozen', False):
+        try:
+            RESOURCES_DIR.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning("Could not create resources directory at %s: %s", RESOURCES_DIR, e)
+    return RESOURCES_DIR
+
+@functools.lru_cache(maxsize=1)
+def ensure_user_config_dir() -> Path:
+    """
+    Create the user config directory on first use.
+    
+    The check runs at most once per process.
+    
+    Returns:
+        Path: The user config directory
+    """
     try:
-        os.makedirs(RESOURCES_DIR, exist_ok=True)
-    except OSError:
-        logger.warning(f"Could not create resources directory at {RESOURCES_DIR}")
+        USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning("Could not create user config directory at %s: %s", USER_CONFIG_DIR, e)
+    return USER_CONFIG_DIR
 
-# Create user config directory if it doesn't exist
-try:
-    os.makedirs(USER_CONFIG_DIR, exist_ok=True)
-except OSError:
-    logger.warning(f"Could not create user config directory at {USER_CONFIG_DIR}")
+# Bound once so the lookup does not need repeating on every call
+_win32_edition = getattr(platform, "win32_edition", lambda: "Unknown")
+_freedesktop_os_release = getattr(platform, "freedesktop_os_release", lambda: "Unknown")
 
-def get_platform_info() -> Dict[str, Any]:
+@functools.lru_cache(maxsize=1)
+def _compute_platform_info() -> Dict[str, Any]:
     """
-    Get detailed information about the current platform.
+    Collect platform information once per process.
     
-    This is useful for debugging and logging.
+    ``platform.processor()`` and friends may shell out or hit the registry,
+    and their results never change while the application is running.
     
     Returns:
         Dict[str, Any]: Platform information including OS, version, and Python version
@@ -83,29 +113,46 @@ def get_platform_info() -> Dict[str, Any]:
     # Add platform-specific details
     if IS_WINDOWS:
         info["windows_version"] = platform.version()
-        info["windows_edition"] = platform.win32_edition() if hasattr(platform, 'win32_edition') else "Unknown"
+        info["windows_edition"] = _win32_edition()
     elif IS_MACOS:
         info["mac_version"] = platform.mac_ver()[0]
     elif IS_LINUX:
-        info["linux_distribution"] = platform.freedesktop_os_release() if hasattr(platform, 'freedesktop_os_release') else "Unknown"
+        try:
+            info["linux_distribution"] = _freedesktop_os_release()
+        except OSError:
+            info["linux_distribution"] = "Unknown"
     
     return info
 
+def get_platform_info() -> Dict[str, Any]:
+    """
+    Get detailed information about the current platform.
+    
+    This is useful for debugging and logging. The underlying probes run only
+    once; subsequent calls return a deep copy of the cached result, so
+    callers may modify it (including nested values) freely.
+    
+    Returns:
+        Dict[str, Any]: Platform information including OS, version, and Python version
+    """
+    return copy.deepcopy(_compute_platform_info())
+
+@functools.lru_cache(maxsize=1)
 def check_dependencies() -> bool:
     """
     Verify that all required dependencies are available.
     
+    Packages are located with ``importlib.util.find_spec`` so that their
+    top-level code is not executed just to probe for presence.
+    
     Returns:
         bool: True if all dependencies are available, False otherwise
     """
     required_packages = ['PyQt5', 'pynput', 'mss', 'PIL']
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    missing_packages = [
+        package for package in required_packages
+        if importlib.util.find_spec(package) is None
+    ]
     
     if missing_packages:
         logger.error(f"Missing required packages: {', '.join(missing_packages)}")
@@ -113,19 +160,60 @@ def check_dependencies() -> bool:
     
     return True
 
-# Import main classes for easier access - this should happen after all the initialization
-try:
-    from .magnifier import Magnifier
-    from .magnifier_gui import MagnifierGUI
+# Heavy submodules (PyQt5, pynput, mss, PIL) are imported lazily on first
+# attribute access so that ``import pyscope`` stays cheap (PEP 562)
+_LAZY_ATTRS = {
+    "Magnifier": ".magnifier",
+    "MagnifierGUI": ".magnifier_gui",
+    "utils": ".utils",
+}
+
+__all__ = [
+    "Magnifier",
+    "MagnifierGUI",
+    "utils",
+    "get_platform_info",
+    "check_dependencies",
+    "ensure_resources_dir",
+    "ensure_user_config_dir",
+    "__version__",
+]
+
+def __getattr__(name: str) -> Any:
+    """
+    Import heavy submodules on first access.
     
-    # Ensure utils package is properly imported
-    from . import utils
-except ImportError as e:
-    logger.error(f"Error importing PyScope modules: {e}")
-    raise
+    Args:
+        name (str): The attribute being looked up
+        
+    Returns:
+        Any: The lazily imported module or class
+        
+    Raises:
+        AttributeError: If the attribute is not a known lazy attribute
+    """
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ImportError as e:
+        logger.error(f"Error importing PyScope modules: {e}")
+        raise
+    
+    value = module if name == "utils" else getattr(module, name)
+    # Cache in the module namespace so __getattr__ is not hit again
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Include lazily loaded attributes in ``dir(pyscope)``."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 # Print startup message in debug environments
-if __debug__:
-    logger.debug(f"PyScope {__version__} initialized")
-    logger.debug(f"Platform: {PLATFORM}")
-    logger.debug(f"Native API enabled: {USE_NATIVE_API}")
+if __debug__ and logger.isEnabledFor(logging.DEBUG):
+    logger.debug("PyScope %s initialized", __version__)
+    logger.debug("Platform: %s", PLATFORM)
+    logger.debug("Native API enabled: %s", USE_NATIVE_API)
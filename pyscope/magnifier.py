@@ -10,21 +10,50 @@ on other platforms.
 import numpy as np
 import platform
 import sys
+import time
+import threading
 import logging
+import zlib
 import ctypes
-from ctypes import windll, c_int, c_float, Structure, POINTER, WinError, WINFUNCTYPE, byref
-from ctypes.wintypes import BOOL, HWND, RECT, DWORD, ULONG
-from PIL import Image, ImageQt
-from PyQt5.QtCore import Qt, QRect, QPoint, QTimer, QSize, QRectF, QThread  # Added QRectF, QThread
-from PyQt5.QtGui import QPainterPath, QPainter, QPen, QColor, QImage  # Added QImage
+from ctypes import windll, c_int, c_float, c_void_p, Structure, POINTER, WinError, WINFUNCTYPE, byref
+from ctypes.wintypes import (BOOL, HWND, RECT, DWORD, ULONG, UINT, HANDLE, LONG, LPCWSTR,
+                             WPARAM, LPARAM, LARGE_INTEGER)
+import PIL
+from PIL import Image
+from PyQt5.QtCore import Qt, QEvent, QRect, QPoint, QTimer, QSize, QRectF, QThread, pyqtSignal  # Added QRectF, QThread
+from PyQt5.QtGui import QPainter, QPen, QColor, QImage  # Added QImage
 from PyQt5.QtWidgets import QWidget, QApplication
 from PyQt5.QtGui import QRegion
 import mss
 
+try:
+    import cv2
+except ImportError:  # OpenCV is optional; fall back to PIL resampling
+    cv2 = None
+
+try:
+    import xxhash
+    _frame_hash = xxhash.xxh3_64_intdigest
+except ImportError:  # xxhash is optional; crc32 is fast enough for small captures
+    _frame_hash = zlib.crc32
+
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Resampling filters used at fractional zoom levels, by quality setting
+QUALITY_LEVELS = ("fast", "balanced", "best")
+_CV2_INTERPOLATION = {
+    "fast": cv2.INTER_LINEAR,
+    "balanced": cv2.INTER_CUBIC,
+    "best": cv2.INTER_LANCZOS4,
+} if cv2 is not None else {}
+_PIL_RESAMPLING = {
+    "fast": Image.BILINEAR,
+    "balanced": Image.BICUBIC,
+    "best": Image.LANCZOS,
+}
+
 
 class Magnifier:
     """Main class for screen magnification functionality."""
@@ -42,22 +71,35 @@ class Magnifier:
         self.zoom_level_high = 4.0
         self.zoom_level_low = 2.0
         self.zoom_state = False
+        self.quality = "balanced"
 
         # Internal state
         self.visible = False
         self.is_initialized = False
         self.window = None
-        self.timer = None
+        self.capture_worker = None
         self.app = None
         self.use_native_api = False
         self.native_magnifier = None
+        self.dxcam = None
+        self._dxcam_region = None
 
         # Screen capture (for non-native approach)
-        self.sct = None
+        self._monitor = {"top": 0, "left": 0, "width": 0, "height": 0}
+        self._capture_box = (0, 0, 0, 0)
+        self._capture_key = None
+        self._screen_width = 0
+        self._screen_height = 0
+        self._display_refresh_rate = 0
+        self._last_frame_key = None
+        self._resize_maps_key = None
+        self._resize_maps = None
 
         # System info
         self.system = platform.system()
         logger.info(f"Initializing magnifier on {self.system}")
+        # Pillow-SIMD builds carry a ".postN" version suffix
+        logger.info(f"Pillow version: {PIL.__version__}, OpenCV available: {cv2 is not None}")
 
     def initialize(self):
         """
@@ -66,7 +108,7 @@ class Magnifier:
         This method prepares the magnifier by:
         1. Creating the application window
         2. Setting up platform-specific magnification capabilities
-        3. Initializing the refresh timer
+        3. Creating the background capture worker
 
         Returns:
             bool: True if initialization was successful, False otherwise
@@ -86,9 +128,14 @@ class Magnifier:
             # Create the magnifier window
             self.window = MagnifierWindow(self)
 
-            # Set up refresh timer
-            self.timer = QTimer()
-            self.timer.timeout.connect(self.update_magnifier)
+            # Cache the screen size and refresh it only when the screen changes
+            self._update_screen_size()
+            QApplication.primaryScreen().geometryChanged.connect(self._on_screen_geometry_changed)
+
+            # Set up the capture worker; frames are delivered to the window
+            # through a queued signal so the GUI thread only has to repaint
+            self.capture_worker = CaptureWorker(self)
+            self.capture_worker.frame_ready.connect(self.window.set_image)
             self.set_refresh_rate(self.refresh_rate)
 
             self.is_initialized = True
@@ -104,7 +151,9 @@ class Magnifier:
         Initialize platform-specific magnification capabilities.
 
         On Windows, attempts to use the Windows Magnification API.
-        On other platforms, falls back to screen capture approach.
+        On other platforms, falls back to screen capture approach. On Windows
+        the screen capture approach prefers DXGI Desktop Duplication (dxcam)
+        over mss when it is installed.
         """
         if self.system == "Windows":
             try:
@@ -123,9 +172,21 @@ class Magnifier:
                 logger.warning(f"Error initializing Windows Magnification API: {e}")
                 self.use_native_api = False
 
-        # Fallback to screen capture method
+        # Fallback to screen capture method (the capture worker owns the mss instance)
         logger.info("Using screen capture magnification method")
-        self.sct = mss.mss()
+
+        if self.system == "Windows":
+            try:
+                # DXGI Desktop Duplication avoids the GDI blit mss relies on
+                import dxcam
+                self.dxcam = dxcam.create(output_color="BGRA")
+                if self.dxcam is not None:
+                    logger.info("Using DXGI Desktop Duplication for screen capture")
+            except ImportError:
+                logger.info("dxcam not installed, using mss for screen capture")
+            except Exception as e:
+                logger.warning(f"Could not initialize DXGI Desktop Duplication, using mss: {e}")
+                self.dxcam = None
 
     def set_resolution(self, width, height):
         """
@@ -171,13 +232,9 @@ class Magnifier:
         Args:
             refresh_rate (int): Frames per second (1-144)
         """
+        # The capture worker reads this on every frame
         self.refresh_rate = max(1, min(144, refresh_rate))
 
-        # Update timer interval
-        if self.timer:
-            interval = int(1000 / self.refresh_rate)
-            self.timer.setInterval(interval)
-
         # Update native magnifier if using it
         if self.use_native_api and self.native_magnifier:
             self.native_magnifier.set_refresh_rate(refresh_rate)
@@ -195,6 +252,33 @@ class Magnifier:
         if self.use_native_api and self.native_magnifier:
             self.native_magnifier.set_zoom_level(self.zoom_level)
 
+    def set_quality(self, quality):
+        """
+        Set the resampling quality.
+
+        Fractional zoom levels are resampled with the matching filter.
+        Integer zoom levels are magnified while painting: bilinearly, or by
+        plain pixel replication (nearest neighbour) with "fast".
+
+        Args:
+            quality (str): One of "fast" (bilinear), "balanced" (bicubic) or
+                "best" (Lanczos)
+        """
+        if quality not in QUALITY_LEVELS:
+            logger.warning(f"Unknown quality '{quality}', using 'balanced'")
+            quality = "balanced"
+        self.quality = quality
+
+        # The frame key includes the quality, so the next capture is resampled
+        # again even on a static screen; dxcam reports no new frame then, so
+        # make the worker grab one
+        self._dxcam_region = None
+
+        # At integer zoom the filter is chosen while painting, so repaint the
+        # frame on display right away
+        if self.window:
+            self.window.update()
+
     def toggle_zoom_preset(self):
         """
         Toggle between high and low zoom presets.
@@ -232,36 +316,72 @@ class Magnifier:
         if self.use_native_api and self.native_magnifier:
             self.native_magnifier.move_window(x_offset, y_offset)
 
+    def _update_screen_size(self):
+        """
+        Cache the screen size.
+
+        Querying the desktop geometry crosses into Qt/the window system, and
+        Qt widgets must not be queried from the capture worker thread, so the
+        size is read once on the GUI thread and refreshed on screen changes.
+        """
+        geometry = QApplication.desktop().screenGeometry()
+        self._screen_width = geometry.width()
+        self._screen_height = geometry.height()
+        self._display_refresh_rate = QApplication.primaryScreen().refreshRate()
+
+    def _on_screen_geometry_changed(self, geometry):
+        """
+        Refresh cached screen metrics after a resolution change.
+
+        Args:
+            geometry (QRect): The new geometry of the primary screen
+        """
+        self._screen_width = geometry.width()
+        self._screen_height = geometry.height()
+        self._display_refresh_rate = QApplication.primaryScreen().refreshRate()
+        logger.info(f"Screen geometry changed: {self._screen_width}x{self._screen_height}")
+
+        if self.use_native_api and self.native_magnifier:
+            self.native_magnifier.refresh_screen_metrics()
+        self._update_window_position()
+
+    def effective_refresh_rate(self):
+        """
+        Get the rate frames are actually captured at.
+
+        Capturing faster than the display refreshes only burns CPU, so the
+        configured refresh rate is capped at the primary screen's rate.
+
+        Returns:
+            float: Frames per second
+        """
+        if self._display_refresh_rate > 1:
+            return min(self.refresh_rate, self._display_refresh_rate)
+        return self.refresh_rate
+
     def _update_window_position(self):
         """Update the window position based on current settings."""
         if not self.window:
             return
 
-        screen_width = QApplication.desktop().screenGeometry().width()
-        screen_height = QApplication.desktop().screenGeometry().height()
-        x = (screen_width - self.width) // 2 + self.x_offset
-        y = (screen_height - self.height) // 2 + self.y_offset
+        x = (self._screen_width - self.width) // 2 + self.x_offset
+        y = (self._screen_height - self.height) // 2 + self.y_offset
         self.window.move(x, y)
 
     def safe_start_timer(self):
-        """Start the timer from the main GUI thread."""
-        if self.timer:
+        """Start the capture worker from the main GUI thread."""
+        if self.capture_worker:
             if QApplication.instance().thread() == QThread.currentThread():
                 # Already in the main thread
-                self.timer.start()
+                self.capture_worker.start_capture()
             else:
-                # Create a single-shot timer to start our main timer in the main thread
-                QTimer.singleShot(0, self.timer.start)
+                # Create a single-shot timer to start the worker from the main thread
+                QTimer.singleShot(0, self.capture_worker.start_capture)
 
     def safe_stop_timer(self):
-        """Stop the timer from the main GUI thread."""
-        if self.timer:
-            if QApplication.instance().thread() == QThread.currentThread():
-                # Already in the main thread
-                self.timer.stop()
-            else:
-                # Create a single-shot timer to stop our main timer in the main thread
-                QTimer.singleShot(0, self.timer.stop)
+        """Stop the capture worker (safe to call from any thread)."""
+        if self.capture_worker:
+            self.capture_worker.stop_capture()
 
     def show_window(self):
         """Show the magnifier window."""
@@ -278,7 +398,7 @@ class Magnifier:
         if self.window:
             self._update_window_position()
             QTimer.singleShot(0, lambda: self.window.show())  # Show window in main thread
-            self.safe_start_timer()  # Start timer safely
+            self.safe_start_timer()  # Start capture worker safely
             self.visible = True
 
     def hide_window(self):
@@ -292,7 +412,7 @@ class Magnifier:
         # Use Qt window
         if self.window:
             QTimer.singleShot(0, lambda: self.window.hide())  # Hide window in main thread
-            self.safe_stop_timer()  # Stop timer safely
+            self.safe_stop_timer()  # Stop capture worker safely
             self.visible = False
 
     def toggle_visibility(self):
@@ -317,64 +437,186 @@ class Magnifier:
         """
         return self.visible
 
-    def update_magnifier(self):
-        """Update the magnified content."""
-        if not self.visible or not self.window:
-            return
+    def update_magnifier(self, sct, out=None):
+        """
+        Capture and resize one frame of magnified content.
 
-        # Skip update if using native magnifier - it handles its own updates
-        if self.use_native_api and self.native_magnifier:
-            return
+        Called by the capture worker thread for every frame.
 
-        try:
-            # Get screen size
-            screen_width = QApplication.desktop().screenGeometry().width()
-            screen_height = QApplication.desktop().screenGeometry().height()
+        Args:
+            sct (mss.base.MSSBase): Screen grabber owned by the calling thread
+            out (numpy.ndarray, optional): Preallocated BGRA buffer to resize into
 
-            # Calculate the center of the screen with offset
-            center_x = screen_width // 2 + self.x_offset
-            center_y = screen_height // 2 + self.y_offset
+        Returns:
+            numpy.ndarray or None: BGRA frame, or None if there is nothing to
+                display. At integer zoom levels this is the unscaled capture,
+                which MagnifierWindow magnifies while painting.
+        """
+        if not self.visible or not self.window:
+            return None
 
-            # Calculate the source rectangle to capture
-            scaled_width = int(self.width / self.zoom_level)
-            scaled_height = int(self.height / self.zoom_level)
+        # Skip update if using native magnifier - it handles its own updates
+        if self.use_native_api and self.native_magnifier:
+            return None
+
+        # Read the settings once; they may be changed from the GUI thread
+        width = self.width
+        height = self.height
+        zoom_level = self.zoom_level
+        quality = self.quality
+
+        # The capture region only changes with the settings or the screen size,
+        # so it is recomputed only when one of those inputs changed
+        capture_key = (width, height, zoom_level, self.x_offset, self.y_offset,
+                       self._screen_width, self._screen_height)
+        if capture_key != self._capture_key:
+            self._update_capture_region(*capture_key)
+            self._capture_key = capture_key
+        monitor = self._monitor
+
+        frame = None
+        if self.dxcam is not None:
+            # Desktop Duplication returns None when the screen has not changed,
+            # in which case the frame on display is still current - unless the
+            # capture region itself moved, which needs a fresh grab below
+            region = self._capture_box
+            frame = self.dxcam.grab(region=region)
+            if frame is None and region == self._dxcam_region:
+                return None
+            self._dxcam_region = region
+
+        if frame is None:
+            # Capture the screen region and view the backend's own BGRA buffer
+            # (ScreenShot.bgra would make a bytes copy of it first)
+            screenshot = sct.grab(monitor)
+            frame = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+                screenshot.height, screenshot.width, 4
+            )
 
-            # Calculate capture area
-            left = center_x - scaled_width // 2
-            top = center_y - scaled_height // 2
+        # Skip the resize and repaint entirely if neither the captured pixels
+        # nor the output size or quality changed since the last frame. The
+        # capture is hashed before upscaling, so this touches only
+        # width*height/zoom^2 pixels.
+        frame = np.ascontiguousarray(frame)
+        frame_key = (_frame_hash(frame), width, height, quality)
+        if frame_key == self._last_frame_key:
+            return None
+        self._last_frame_key = frame_key
+
+        # Qt treats Format_RGB32 as 0xffRRGGBB but blits it into the translucent
+        # window's ARGB32 backing store as a plain copy, so the pad byte mss
+        # leaves at 0 would show up as alpha. Force it opaque on the small
+        # capture, before any resize propagates it to the full-size frame.
+        if not frame.flags.writeable:
+            frame = frame.copy()
+        frame[..., 3] = 255
+
+        # Integer zoom levels map source pixels onto whole output pixels, where
+        # a 2-tap bilinear filter looks the same as the wider cubic/Lanczos
+        # kernels. Hand over the small capture as-is and let the window's
+        # smooth-transform drawImage magnify it straight into the backing
+        # store, so no full-size intermediate frame is produced at all.
+        if zoom_level == int(zoom_level):
+            return frame
+
+        if cv2 is not None:
+            # Resize the BGRA buffer directly
+            if out is None or out.shape != (height, width, 4):
+                out = np.empty((height, width, 4), dtype=np.uint8)
+            # Fractional zoom: remap through sampling maps that are only rebuilt
+            # when the source or output size changes, instead of letting
+            # cv2.resize recompute its coefficient tables every frame
+            map1, map2 = self._get_resize_maps(frame.shape[1], frame.shape[0], width, height)
+            return cv2.remap(frame, map1, map2, _CV2_INTERPOLATION[quality], dst=out,
+                             borderMode=cv2.BORDER_REPLICATE)
+
+        # Resize with PIL, keeping the native BGRA byte order
+        # ("RGBX" avoids the alpha premultiplication PIL applies to RGBA)
+        img = Image.frombuffer("RGBX", (frame.shape[1], frame.shape[0]), frame, "raw", "RGBX", 0, 1)
+        img = img.resize((width, height), _PIL_RESAMPLING[quality])
+        return np.asarray(img)
+
+    def _update_capture_region(self, width, height, zoom_level, x_offset, y_offset,
+                               screen_width, screen_height):
+        """
+        Recompute the source rectangle for the current settings.
 
-            # Ensure the capture area is within the screen bounds
-            left = max(0, min(left, screen_width - scaled_width))
-            top = max(0, min(top, screen_height - scaled_height))
+        Updates the cached mss monitor dict in place and the matching
+        (left, top, right, bottom) box used by dxcam.
 
-            # Check if monitor definition needs to be updated (optimize by not recreating every frame)
-            monitor = {"top": top, "left": left, "width": scaled_width, "height": scaled_height}
+        Args:
+            width (int): Width of the magnifier window
+            height (int): Height of the magnifier window
+            zoom_level (float): Current zoom level
+            x_offset (int): Horizontal offset from screen center
+            y_offset (int): Vertical offset from screen center
+            screen_width (int): Width of the screen
+            screen_height (int): Height of the screen
+        """
+        # Calculate the center of the screen with offset
+        center_x = screen_width // 2 + x_offset
+        center_y = screen_height // 2 + y_offset
+
+        # Calculate the source rectangle to capture
+        scaled_width = int(width / zoom_level)
+        scaled_height = int(height / zoom_level)
+
+        # Calculate capture area
+        left = center_x - scaled_width // 2
+        top = center_y - scaled_height // 2
+
+        # Ensure the capture area is within the screen bounds
+        left = max(0, min(left, screen_width - scaled_width))
+        top = max(0, min(top, screen_height - scaled_height))
+
+        # Update the cached monitor definition in place instead of rebuilding it
+        monitor = self._monitor
+        monitor["top"] = top
+        monitor["left"] = left
+        monitor["width"] = scaled_width
+        monitor["height"] = scaled_height
+        self._capture_box = (left, top, left + scaled_width, top + scaled_height)
+
+    def _get_resize_maps(self, src_width, src_height, dst_width, dst_height):
+        """
+        Get cached cv2.remap sampling maps for a resize.
 
-            # Capture the screen region
-            screenshot = self.sct.grab(monitor)
+        The maps reproduce cv2.resize's pixel-centre alignment and are stored
+        in OpenCV's fixed-point format, which remaps faster than float maps.
 
-            # Convert to PIL Image and resize
-            # Use LANCZOS for better quality when scaling up
-            img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-            img = img.resize((self.width, self.height), Image.LANCZOS)
+        Args:
+            src_width (int): Width of the captured region
+            src_height (int): Height of the captured region
+            dst_width (int): Width of the output frame
+            dst_height (int): Height of the output frame
 
-            # Update the window with the new image
-            self.window.set_image(img)
-        except Exception as e:
-            logger.error(f"Error updating magnifier content: {e}")
+        Returns:
+            tuple: The (map1, map2) pair to pass to cv2.remap
+        """
+        key = (src_width, src_height, dst_width, dst_height)
+        if key != self._resize_maps_key:
+            xs = (np.arange(dst_width, dtype=np.float32) + 0.5) * (src_width / dst_width) - 0.5
+            ys = (np.arange(dst_height, dtype=np.float32) + 0.5) * (src_height / dst_height) - 0.5
+            map_x = np.ascontiguousarray(np.broadcast_to(xs, (dst_height, dst_width)))
+            map_y = np.ascontiguousarray(np.broadcast_to(ys[:, None], (dst_height, dst_width)))
+            self._resize_maps = cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+            self._resize_maps_key = key
+        return self._resize_maps
 
     def dispose(self):
         """Clean up resources and prepare for application exit."""
         logger.info("Disposing magnifier resources")
 
-        if self.timer:
-            self.timer.stop()
+        if self.capture_worker:
+            self.capture_worker.stop_capture()
+            self.capture_worker.wait()
 
         if self.window:
             self.window.close()
 
-        if self.sct:
-            self.sct.close()
+        if self.dxcam is not None:
+            self.dxcam.release()
+            self.dxcam = None
 
         if self.use_native_api and self.native_magnifier:
             self.native_magnifier.dispose()
@@ -382,6 +624,115 @@ class Magnifier:
         self.is_initialized = False
 
 
+class CaptureWorker(QThread):
+    """
+    Background thread that captures and resizes frames for the magnifier.
+
+    Frames are handed to the GUI thread through the ``frame_ready`` signal,
+    so capture and resize overlap with painting instead of blocking the
+    event loop. Resized frames are written into a small ring of
+    preallocated buffers; the receiver keeps a reference to the array it
+    displays, so reallocating the ring never frees a buffer in use.
+
+    At most one frame is in flight: no new frame is produced until the
+    receiver calls ``frame_consumed()``. The worker therefore never writes
+    into the slot on screen or into one still queued in ``frame_ready``.
+    """
+
+    frame_ready = pyqtSignal(object)
+
+    # Number of preallocated frame buffers
+    BUFFER_COUNT = 3
+
+    # Once the captured content has not changed for IDLE_AFTER seconds, poll
+    # at IDLE_REFRESH_RATE until it changes again
+    IDLE_AFTER = 1.0
+    IDLE_REFRESH_RATE = 5
+
+    def __init__(self, magnifier):
+        super().__init__()
+        self.magnifier = magnifier
+        self._stop_event = threading.Event()
+        self._frame_in_flight = threading.Event()
+        self._buffers = []
+        self._buffer_index = 0
+
+    def start_capture(self):
+        """Start capturing, restarting the thread if it is shutting down."""
+        if self.isRunning():
+            if not self._stop_event.is_set():
+                return
+            self.wait()
+        self._stop_event.clear()
+        self._frame_in_flight.clear()
+        self.start()
+
+    def stop_capture(self):
+        """Ask the capture loop to exit (safe to call from any thread)."""
+        self._stop_event.set()
+
+    def frame_consumed(self):
+        """Signal that the last emitted frame was taken over by the receiver."""
+        self._frame_in_flight.clear()
+
+    def _next_buffer(self, width, height):
+        """
+        Get the next buffer from the ring, reallocating it if the size changed.
+
+        Args:
+            width (int): Frame width in pixels
+            height (int): Frame height in pixels
+
+        Returns:
+            numpy.ndarray: Buffer of shape (height, width, 4)
+        """
+        shape = (height, width, 4)
+        if not self._buffers or self._buffers[0].shape != shape:
+            self._buffers = [np.empty(shape, dtype=np.uint8) for _ in range(self.BUFFER_COUNT)]
+        self._buffer_index = (self._buffer_index + 1) % self.BUFFER_COUNT
+        return self._buffers[self._buffer_index]
+
+    def run(self):
+        """Capture frames paced to the magnifier's refresh rate until stopped."""
+        magnifier = self.magnifier
+        # mss instances are not thread-safe, so the worker owns its own
+        sct = mss.mss()
+        next_frame = time.perf_counter()
+        unchanged_frames = 0
+
+        try:
+            while not self._stop_event.is_set():
+                # Skip the grab while the GUI thread has not picked up the last
+                # frame yet, rather than resizing into a slot it may still use
+                if not self._frame_in_flight.is_set():
+                    try:
+                        buffer = self._next_buffer(magnifier.width, magnifier.height)
+                        frame = magnifier.update_magnifier(sct, buffer)
+                        if frame is not None:
+                            unchanged_frames = 0
+                            self._frame_in_flight.set()
+                            self.frame_ready.emit(frame)
+                        else:
+                            unchanged_frames += 1
+                    except Exception as e:
+                        logger.error(f"Error updating magnifier content: {e}")
+
+                refresh_rate = magnifier.effective_refresh_rate()
+                if unchanged_frames >= refresh_rate * self.IDLE_AFTER:
+                    # Static screen; back off until the content changes
+                    refresh_rate = min(refresh_rate, self.IDLE_REFRESH_RATE)
+                next_frame += 1.0 / refresh_rate
+                delay = next_frame - time.perf_counter()
+                if delay > 0:
+                    # Returns early when stop_capture() is called
+                    self._stop_event.wait(delay)
+                else:
+                    # Running behind; resynchronise instead of bursting to catch up
+                    next_frame = time.perf_counter()
+        finally:
+            sct.close()
+
+
 class MagnifierWindow(QWidget):
     """Window class for displaying the magnified content."""
 
@@ -389,6 +740,9 @@ class MagnifierWindow(QWidget):
         super().__init__()
         self.magnifier = magnifier
         self.image = None
+        self.frame = None
+        self.alpha_mask = None
+        self._shape_key = None
 
         # Set window properties
         self.setWindowFlags(
@@ -414,22 +768,42 @@ class MagnifierWindow(QWidget):
         # Update window shape (circular/rectangular)
         self.update_shape()
 
-    def set_image(self, image):
+    def set_image(self, frame):
         """
         Set the image to display.
 
         Args:
-            image (PIL.Image): The image to display
+            frame (numpy.ndarray): BGRA pixel data of shape (height, width, 4),
+                as delivered by mss
         """
-        # Convert PIL image to QImage properly
-        img_data = image.convert("RGBA").tobytes("raw", "RGBA")
-        self.image = QImage(img_data, image.width, image.height, QImage.Format_RGBA8888)
+        # QImage does not copy the buffer, so keep the array alive alongside it
+        self.frame = np.ascontiguousarray(frame)
+        height, width = self.frame.shape[:2]
+        # Format_RGB32 is BGRA in memory on little-endian machines, so the
+        # capture is displayed without any channel conversion. Qt expects the
+        # fourth byte to be 0xff; update_magnifier makes it so.
+        self.image = QImage(self.frame.data, width, height, self.frame.strides[0], QImage.Format_RGB32)
         self.update()
 
+        # Let the worker produce the next frame now that this one is held here
+        if self.magnifier.capture_worker is not None:
+            self.magnifier.capture_worker.frame_consumed()
+
     def update_shape(self):
-        """Update the window shape based on settings."""
+        """
+        Update the window shape based on settings.
+
+        setMask reshapes the native window, so nothing is done unless the
+        size or shape actually changed.
+        """
+        shape_key = (self.magnifier.width, self.magnifier.height, self.magnifier.circular)
+        if shape_key == self._shape_key:
+            return
+        self._shape_key = shape_key
+
         if self.magnifier.circular:
-            # Create a circular mask for the window
+            # Create a circular mask for the window (used for hit-testing and
+            # by the window system; it can only give an aliased edge)
             region = QRegion(
                 0, 0,
                 self.magnifier.width,
@@ -437,9 +811,59 @@ class MagnifierWindow(QWidget):
                 QRegion.Ellipse
             )
             self.setMask(region)
+
+            # Rasterize the antialiased ellipse once; paintEvent composites it
+            # over each frame instead of building and tessellating a clip path
+            self.alpha_mask = QImage(self.magnifier.width, self.magnifier.height, QImage.Format_Alpha8)
+            self.alpha_mask.fill(Qt.transparent)
+            mask_painter = QPainter(self.alpha_mask)
+            mask_painter.setRenderHint(QPainter.Antialiasing)
+            mask_painter.setPen(Qt.NoPen)
+            mask_painter.setBrush(Qt.black)
+            mask_painter.drawEllipse(QRectF(0, 0, self.magnifier.width, self.magnifier.height))
+            mask_painter.end()
         else:
             # Restore rectangular shape
             self.clearMask()
+            self.alpha_mask = None
+
+    def showEvent(self, event):
+        """
+        Resume capturing when the window is shown again.
+
+        Args:
+            event (QShowEvent): The show event
+        """
+        super().showEvent(event)
+        if self.magnifier.visible and not self.isMinimized():
+            self.magnifier.safe_start_timer()
+
+    def hideEvent(self, event):
+        """
+        Pause capturing while the window is hidden.
+
+        Covers hides that do not go through Magnifier.hide_window, so the
+        worker never keeps waking up to capture frames nobody can see.
+
+        Args:
+            event (QHideEvent): The hide event
+        """
+        super().hideEvent(event)
+        self.magnifier.safe_stop_timer()
+
+    def changeEvent(self, event):
+        """
+        Pause capturing while the window is minimized.
+
+        Args:
+            event (QEvent): The change event
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.magnifier.safe_stop_timer()
+            elif self.magnifier.visible and self.isVisible():
+                self.magnifier.safe_start_timer()
 
     def paintEvent(self, event):
         """
@@ -453,21 +877,27 @@ class MagnifierWindow(QWidget):
 
         painter = QPainter(self)
 
-        # Set up rendering for high quality
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-
-        # Draw the magnified image
-        if self.magnifier.circular:
-            # Create a clipping path for the circular shape
-            path = QPainterPath()
-            path.addEllipse(0, 0, self.width(), self.height())
-            painter.setClipPath(path)
+        # Only image drawing happens here, so Antialiasing (which affects
+        # vector primitives) is not needed. Without smooth transforms,
+        # integer-zoom frames are magnified by exact pixel replication,
+        # which is the cheapest scaling the raster engine can do.
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, self.magnifier.quality != "fast")
 
         # Use QRectF instead of QRect for better compatibility
+        # (frames smaller than the window are magnified here, bilinearly)
         target_rect = QRectF(0, 0, self.width(), self.height())
         painter.drawImage(target_rect, self.image)
 
+        # Cut out the circular shape with the precomputed alpha mask
+        if self.magnifier.circular and self.alpha_mask is not None:
+            painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+            painter.drawImage(0, 0, self.alpha_mask)
+
+
+class MAGTRANSFORM(Structure):
+    """MAGTRANSFORM matrix structure - 3x3 matrix of floats."""
+    _fields_ = [("v", c_float * 9)]
+
 
 class WindowsMagnifier:
     """Windows-specific magnification implementation using the Windows Magnification API."""
@@ -481,6 +911,17 @@ class WindowsMagnifier:
     WS_POPUP = 0x80000000
     WS_VISIBLE = 0x10000000
     WC_MAGNIFIER = "Magnifier" # Class name for magnifier control
+    WM_NCDESTROY = 0x0082
+    WM_APP_TICK = 0x8001  # WM_APP + 1, posted by the frame pacer thread
+    GWLP_WNDPROC = -4
+    CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+    TIMER_ALL_ACCESS = 0x001F0003
+    WAIT_OBJECT_0 = 0x00000000
+    INFINITE = 0xFFFFFFFF
+
+    # Window proc callbacks that may still be installed on a window that
+    # could not be destroyed; freeing them would crash on its next message
+    _retired_callbacks = []
 
     def __init__(self):
         """Initialize the Windows Magnification API wrapper."""
@@ -493,30 +934,43 @@ class WindowsMagnifier:
         self.zoom_level = 2.0
         self.x_offset = 0
         self.y_offset = 0
-        self.timer_id = 1
         self.initialized = False
+        self.visible = False
+        self.screen_width = 0
+        self.screen_height = 0
+        self.display_refresh_rate = 0
+        self._last_geometry = None
+
+        # Setting changes are coalesced and applied once on the next refresh tick
+        self._geometry_dirty = False
+        self._shape_dirty = False
+        self._transform_dirty = False
 
         # Windows-specific resources
-        self.timer_func = None
         self.wnd_proc = None
+        self._original_wnd_proc = None
         self.user32 = None
+        self.kernel32 = None
+        self.winmm = None
         self.magnification = None
         self.gdi32 = None
 
-        # MAGTRANSFORM matrix structure - 3x3 matrix of floats
-        class MAGTRANSFORM(Structure):
-            _fields_ = [("v", c_float * 9)]
-        self.MAGTRANSFORM = MAGTRANSFORM
-
-        # RECT structure
-        class RECT(Structure):
-            _fields_ = [
-                ("left", c_int),
-                ("top", c_int),
-                ("right", c_int),
-                ("bottom", c_int)
-            ]
-        self.RECT = RECT
+        # Frame pacing (waitable timer driven from a background thread)
+        self._frame_timer = None
+        self._high_res_timer = False
+        self._period_active = False
+        self._stop_event = None
+        self._pacer_thread = None
+        self._tick_pending = False
+
+        # Reused transform; ctypes zero-fills it, so only the scale entries
+        # ever need to be written
+        self._transform = MAGTRANSFORM()
+        self._transform.v[8] = 1.0  # w scale
+
+        # Reused source rectangle, recomputed only when its inputs change
+        self._source_rect = RECT()
+        self._source_key = None
 
     def initialize(self):
         """
@@ -531,10 +985,15 @@ class WindowsMagnifier:
                 logger.warning("Windows Magnification API is only available on Windows")
                 return False
 
-            # Import required functions
-            self.user32 = windll.user32
-            self.magnification = windll.magnification
-            self.gdi32 = windll.gdi32
+            # Import required functions. These are private instances so the
+            # prototypes declared below do not leak into other users of
+            # ctypes.windll (such as pynput).
+            self.user32 = ctypes.WinDLL("user32")
+            self.kernel32 = ctypes.WinDLL("kernel32")
+            self.winmm = ctypes.WinDLL("winmm")
+            self.magnification = ctypes.WinDLL("magnification")
+            self.gdi32 = ctypes.WinDLL("gdi32")
+            self._bind_prototypes()
 
             # Initialize magnification
             if not self.magnification.MagInitialize():
@@ -542,34 +1001,35 @@ class WindowsMagnifier:
                 return False
 
             # Define WndProc callback
-            WndProc = WINFUNCTYPE(c_int, HWND, c_int, c_int, c_int)
+            WndProc = WINFUNCTYPE(LPARAM, HWND, UINT, WPARAM, LPARAM)
 
-            # Create the window proc callback
+            # Create the window proc callback. It subclasses the host window,
+            # so messages it does not handle go to the original window proc.
             def wnd_proc_callback(hwnd, msg, wparam, lparam):
-                # WM_TIMER = 0x0113
-                if msg == 0x0113 and wparam == self.timer_id:
+                if msg == WindowsMagnifier.WM_APP_TICK:
+                    self._tick_pending = False
                     self._update_content()
                     return 0
-                # WM_DESTROY = 0x0002
-                elif msg == 0x0002:
-                    self.user32.PostQuitMessage(0)
-                    return 0
-                return self.user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+                original = self._original_wnd_proc
+                if msg == WindowsMagnifier.WM_NCDESTROY:
+                    # Last message for the window; remove the subclass
+                    self._set_window_proc(hwnd, original)
+                    self._original_wnd_proc = None
+                return self.user32.CallWindowProcW(original, hwnd, msg, wparam, lparam)
 
             # Store reference to prevent garbage collection
             self.wnd_proc = WndProc(wnd_proc_callback)
 
             # Register window class (simplified, normally needs WNDCLASSEXW structure)
-            h_instance = windll.kernel32.GetModuleHandleW(None)
+            h_instance = self.kernel32.GetModuleHandleW(None)
             class_name = "PyScope_Magnifier_Host"
 
             # Get screen dimensions for initial positioning
-            screen_width = self.user32.GetSystemMetrics(0)  # SM_CXSCREEN
-            screen_height = self.user32.GetSystemMetrics(1)  # SM_CYSCREEN
+            self.refresh_screen_metrics()
         
             # Calculate initial position - ВАЖНО: используем расчет положения центра
-            x = (screen_width - self.width) // 2 + self.x_offset
-            y = (screen_height - self.height) // 2 + self.y_offset
+            x = (self.screen_width - self.width) // 2 + self.x_offset
+            y = (self.screen_height - self.height) // 2 + self.y_offset
         
             logger.info(f"Initial window position: x={x}, y={y}, width={self.width}, height={self.height}")
 
@@ -588,6 +1048,11 @@ class WindowsMagnifier:
                 self.magnification.MagUninitialize()
                 return False
 
+            # Route the pacer's tick messages through our window proc
+            self._original_wnd_proc = self._set_window_proc(
+                self.hwnd_host, ctypes.cast(self.wnd_proc, c_void_p).value
+            )
+
             # Create magnifier control window as a child of the host
             magnifier_style = self.WS_VISIBLE | 0x40000000 | self.MS_SHOWMAGNIFIEDCURSOR
 
@@ -608,7 +1073,7 @@ class WindowsMagnifier:
                 return False
 
             # Проверка и логирование получившейся геометрии окна
-            rc = self.RECT()
+            rc = RECT()
             if self.user32.GetWindowRect(self.hwnd_host, byref(rc)):
                 logger.info(f"Host window rect: left={rc.left}, top={rc.top}, right={rc.right}, bottom={rc.bottom}")
             
@@ -625,10 +1090,8 @@ class WindowsMagnifier:
                 logger.warning("Failed to get window rectangle.")
 
             # Set initial transform
-            transform = self.MAGTRANSFORM()
-            transform.v[0] = float(self.zoom_level)  # x scale
-            transform.v[4] = float(self.zoom_level)  # y scale
-            transform.v[8] = 1.0  # Additional scale factor
+            transform = self._transform
+            transform.v[0] = transform.v[4] = float(self.zoom_level)  # x and y scale
 
             if not self.magnification.MagSetWindowTransform(self.hwnd_magnifier, byref(transform)):
                 logger.error(f"Failed to set magnification transform. Error code: {WinError()}")
@@ -644,10 +1107,9 @@ class WindowsMagnifier:
             if self.circular:
                 self._set_circular_region()
 
-            # Set refresh timer on the host window
-            interval = int(1000 / self.refresh_rate)
-            if not self.user32.SetTimer(self.hwnd_host, self.timer_id, interval, self.wnd_proc):
-                logger.error(f"Failed to set timer. Error code: {WinError()}")
+            # Create the frame timer; the pacer thread is started on show
+            if not self._create_frame_timer():
+                logger.error(f"Failed to create frame timer. Error code: {WinError()}")
 
             # Для полной уверенности запускаем обновление содержимого сразу
             self._update_content()
@@ -661,6 +1123,246 @@ class WindowsMagnifier:
             self._cleanup_resources()
             return False
 
+    def _bind_prototypes(self):
+        """
+        Declare the ctypes prototypes of the Win32 functions used here.
+
+        With argtypes and restype set, ctypes converts arguments with fixed
+        converters instead of inferring them on every call, and pointer-sized
+        handles are no longer truncated to a C int on 64-bit Python.
+        """
+        user32 = self.user32
+        kernel32 = self.kernel32
+        magnification = self.magnification
+        gdi32 = self.gdi32
+
+        # Pointer-sized arguments and results must not be truncated to int
+        set_window_long = getattr(user32, "SetWindowLongPtrW", None) or user32.SetWindowLongW
+        set_window_long.argtypes = [HWND, c_int, c_void_p]
+        set_window_long.restype = c_void_p
+        self._set_window_long = set_window_long
+
+        user32.CreateWindowExW.argtypes = [DWORD, LPCWSTR, LPCWSTR, DWORD, c_int, c_int, c_int, c_int,
+                                           HWND, c_void_p, c_void_p, c_void_p]
+        user32.CreateWindowExW.restype = HWND
+        user32.DestroyWindow.argtypes = [HWND]
+        user32.DestroyWindow.restype = BOOL
+        user32.ShowWindow.argtypes = [HWND, c_int]
+        user32.ShowWindow.restype = BOOL
+        user32.SetWindowPos.argtypes = [HWND, HWND, c_int, c_int, c_int, c_int, UINT]
+        user32.SetWindowPos.restype = BOOL
+        user32.UpdateWindow.argtypes = [HWND]
+        user32.UpdateWindow.restype = BOOL
+        user32.RedrawWindow.argtypes = [HWND, c_void_p, c_void_p, UINT]
+        user32.RedrawWindow.restype = BOOL
+        user32.GetWindowRect.argtypes = [HWND, POINTER(RECT)]
+        user32.GetWindowRect.restype = BOOL
+        user32.SetWindowRgn.argtypes = [HWND, c_void_p, BOOL]
+        user32.SetWindowRgn.restype = c_int
+        user32.GetSystemMetrics.argtypes = [c_int]
+        user32.GetSystemMetrics.restype = c_int
+        user32.CallWindowProcW.argtypes = [c_void_p, HWND, UINT, WPARAM, LPARAM]
+        user32.CallWindowProcW.restype = LPARAM
+        user32.PostMessageW.argtypes = [HWND, UINT, WPARAM, LPARAM]
+        user32.PostMessageW.restype = BOOL
+        user32.GetDC.argtypes = [HWND]
+        user32.GetDC.restype = c_void_p
+        user32.ReleaseDC.argtypes = [HWND, c_void_p]
+        user32.ReleaseDC.restype = c_int
+
+        gdi32.CreateEllipticRgn.argtypes = [c_int, c_int, c_int, c_int]
+        gdi32.CreateEllipticRgn.restype = c_void_p
+        gdi32.GetDeviceCaps.argtypes = [c_void_p, c_int]
+        gdi32.GetDeviceCaps.restype = c_int
+
+        magnification.MagInitialize.argtypes = []
+        magnification.MagInitialize.restype = BOOL
+        magnification.MagUninitialize.argtypes = []
+        magnification.MagUninitialize.restype = BOOL
+        magnification.MagSetWindowTransform.argtypes = [HWND, POINTER(MAGTRANSFORM)]
+        magnification.MagSetWindowTransform.restype = BOOL
+        magnification.MagSetWindowSource.argtypes = [HWND, RECT]
+        magnification.MagSetWindowSource.restype = BOOL
+
+        kernel32.GetModuleHandleW.argtypes = [LPCWSTR]
+        kernel32.GetModuleHandleW.restype = c_void_p
+        kernel32.CreateWaitableTimerExW.argtypes = [c_void_p, LPCWSTR, DWORD, DWORD]
+        kernel32.CreateWaitableTimerExW.restype = HANDLE
+        kernel32.SetWaitableTimer.argtypes = [HANDLE, POINTER(LARGE_INTEGER), LONG, c_void_p, c_void_p, BOOL]
+        kernel32.SetWaitableTimer.restype = BOOL
+        kernel32.CancelWaitableTimer.argtypes = [HANDLE]
+        kernel32.CancelWaitableTimer.restype = BOOL
+        kernel32.CreateEventW.argtypes = [c_void_p, BOOL, BOOL, LPCWSTR]
+        kernel32.CreateEventW.restype = HANDLE
+        kernel32.SetEvent.argtypes = [HANDLE]
+        kernel32.SetEvent.restype = BOOL
+        kernel32.ResetEvent.argtypes = [HANDLE]
+        kernel32.ResetEvent.restype = BOOL
+        kernel32.WaitForMultipleObjects.argtypes = [DWORD, POINTER(HANDLE), BOOL, DWORD]
+        kernel32.WaitForMultipleObjects.restype = DWORD
+        kernel32.CloseHandle.argtypes = [HANDLE]
+        kernel32.CloseHandle.restype = BOOL
+
+    def _set_window_proc(self, hwnd, wnd_proc):
+        """
+        Replace the window procedure of a window.
+
+        Args:
+            hwnd (int): Window handle
+            wnd_proc (int): Address of the new window procedure
+
+        Returns:
+            int: Address of the previous window procedure
+        """
+        return self._set_window_long(hwnd, WindowsMagnifier.GWLP_WNDPROC, wnd_proc)
+
+    def _create_frame_timer(self):
+        """
+        Create the waitable timer and stop event used by the frame pacer.
+
+        A high-resolution timer (Windows 10 1803+) fires with sub-millisecond
+        accuracy; older systems fall back to a regular waitable timer.
+
+        Returns:
+            bool: True if the timer was created, False otherwise
+        """
+        kernel32 = self.kernel32
+        self._frame_timer = kernel32.CreateWaitableTimerExW(
+            None, None, WindowsMagnifier.CREATE_WAITABLE_TIMER_HIGH_RESOLUTION,
+            WindowsMagnifier.TIMER_ALL_ACCESS
+        )
+        self._high_res_timer = bool(self._frame_timer)
+        if not self._frame_timer:
+            self._frame_timer = kernel32.CreateWaitableTimerExW(
+                None, None, 0, WindowsMagnifier.TIMER_ALL_ACCESS
+            )
+        # Manual-reset event, signalled to stop the pacer thread
+        self._stop_event = kernel32.CreateEventW(None, True, False, None)
+        logger.info(f"Frame timer created (high resolution: {self._high_res_timer})")
+        return bool(self._frame_timer and self._stop_event)
+
+    def _start_pacer(self):
+        """Start the thread that posts a refresh tick for every frame."""
+        if not self._frame_timer or not self._stop_event:
+            return
+        if self._pacer_thread and self._pacer_thread.is_alive():
+            return
+
+        # A regular waitable timer is bound to the scheduler tick; raise the
+        # timer resolution, but only while the magnifier is actually running
+        if not self._high_res_timer and not self._period_active:
+            try:
+                self._period_active = self.winmm.timeBeginPeriod(1) == 0  # TIMERR_NOERROR
+            except Exception as e:
+                logger.warning("timeBeginPeriod failed: %s", e)
+
+        self.kernel32.ResetEvent(self._stop_event)
+        self._tick_pending = False
+        self._pacer_thread = threading.Thread(
+            target=self._pacer, name="PyScopeFramePacer", daemon=True
+        )
+        self._pacer_thread.start()
+
+    def _stop_pacer(self):
+        """Stop the frame pacer thread and wait for it to exit."""
+        if self._pacer_thread:
+            self.kernel32.SetEvent(self._stop_event)
+            self._pacer_thread.join()
+            self._pacer_thread = None
+        if self._frame_timer:
+            self.kernel32.CancelWaitableTimer(self._frame_timer)
+        if self._period_active:
+            self._period_active = False
+            try:
+                self.winmm.timeEndPeriod(1)
+            except Exception as e:
+                logger.warning("timeEndPeriod failed: %s", e)
+
+    def _pacer(self):
+        """
+        Post a refresh tick to the host window at the refresh rate.
+
+        Unlike SetTimer, whose WM_TIMER is quantized to the ~15.6 ms system
+        tick, the waitable timer is re-armed for each frame against a
+        perf_counter schedule so the requested rate is actually reached.
+        The tick is handled by the window proc on the thread that owns the
+        windows, so the Magnification API is never called from this thread.
+        """
+        kernel32 = self.kernel32
+        handles = (HANDLE * 2)(self._frame_timer, self._stop_event)
+        due_time = LARGE_INTEGER()
+        next_frame = time.perf_counter()
+
+        while True:
+            next_frame += 1.0 / self.effective_refresh_rate()
+            delay = next_frame - time.perf_counter()
+            if delay < 0:
+                # Running behind; resynchronise instead of bursting to catch up
+                next_frame = time.perf_counter()
+                delay = 0
+            # Negative due times are relative, in 100 ns units
+            due_time.value = -int(delay * 10_000_000)
+            if not kernel32.SetWaitableTimer(self._frame_timer, byref(due_time), 0, None, None, False):
+                logger.error("Failed to arm frame timer. Error code: %s", WinError())
+                return
+
+            result = kernel32.WaitForMultipleObjects(2, handles, False, WindowsMagnifier.INFINITE)
+            if result != WindowsMagnifier.WAIT_OBJECT_0:
+                # Stop event signalled (or the wait failed)
+                return
+            # At most one tick is queued at a time: if the UI thread is busy,
+            # later ticks are dropped instead of piling up in its queue
+            if not self._tick_pending:
+                self._tick_pending = True
+                if not self.user32.PostMessageW(self.hwnd_host, WindowsMagnifier.WM_APP_TICK, 0, 0):
+                    self._tick_pending = False
+
+    def refresh_screen_metrics(self):
+        """
+        Re-read the screen dimensions.
+
+        The size is cached because it only changes when the display mode does;
+        call this after a resolution change.
+        """
+        if not self.user32:
+            return
+
+        self.screen_width = self.user32.GetSystemMetrics(0)  # SM_CXSCREEN
+        self.screen_height = self.user32.GetSystemMetrics(1)  # SM_CYSCREEN
+        self.display_refresh_rate = self._query_display_refresh_rate()
+        # Re-centre the window on the next tick
+        self._geometry_dirty = True
+
+    def _query_display_refresh_rate(self):
+        """
+        Query the vertical refresh rate of the primary display.
+
+        Returns:
+            int: Refresh rate in Hz, or 0 if it could not be determined
+        """
+        hdc = self.user32.GetDC(None)
+        if not hdc:
+            return 0
+        try:
+            return self.gdi32.GetDeviceCaps(hdc, 116)  # VREFRESH
+        finally:
+            self.user32.ReleaseDC(None, hdc)
+
+    def effective_refresh_rate(self):
+        """
+        Get the rate the magnifier is actually refreshed at.
+
+        The configured refresh rate is capped at the display's refresh rate;
+        updating faster than the monitor can show has no visible benefit.
+
+        Returns:
+            int: Frames per second
+        """
+        # 0 and 1 mean the driver reports the hardware default rate
+        if self.display_refresh_rate > 1:
+            return min(self.refresh_rate, self.display_refresh_rate)
+        return self.refresh_rate
+
     def _set_circular_region(self):
         """Set a circular region for the window."""
         if not self.hwnd_host or not self.gdi32:
@@ -675,96 +1377,174 @@ class WindowsMagnifier:
                 self.user32.SetWindowRgn(self.hwnd_host, region, True)
                 # Do not call DeleteObject if SetWindowRgn succeeds with True
             else:
-                logger.warning(f"Failed to create elliptic region. Error code: {WinError()}")
+                logger.warning("Failed to create elliptic region. Error code: %s", WinError())
         except Exception as e:
-            logger.error(f"Error setting circular region: {e}")
+            logger.error("Error setting circular region: %s", e)
 
 
-    def _update_window_position(self):
-        """Update the window position based on current settings."""
+    def _update_window_position(self, force=False, show=False):
+        """
+        Update the window position based on current settings.
+
+        Nothing is done if the geometry has not changed since the last call,
+        and the magnifier control is only resized when the size changed.
+
+        Args:
+            force (bool): Reapply the position and topmost z-order even if the
+                geometry is unchanged
+            show (bool): Also show the host window (without activating it) in
+                the same SetWindowPos call
+        """
         if not self.hwnd_host or not self.user32:
             return
 
         try:
-            # Get screen dimensions
-            screen_width = self.user32.GetSystemMetrics(0)  # SM_CXSCREEN
-            screen_height = self.user32.GetSystemMetrics(1)  # SM_CYSCREEN
-
             # Calculate window position
-            x = (screen_width - self.width) // 2 + self.x_offset
-            y = (screen_height - self.height) // 2 + self.y_offset
+            x = (self.screen_width - self.width) // 2 + self.x_offset
+            y = (self.screen_height - self.height) // 2 + self.y_offset
+
+            geometry = (x, y, self.width, self.height)
+            if not force and geometry == self._last_geometry:
+                return
+            size_changed = self._last_geometry is None or self._last_geometry[2:] != geometry[2:]
 
-            logger.info(f"Setting window position: x={x}, y={y}, width={self.width}, height={self.height}")
+            logger.info("Setting window position: x=%d, y=%d, width=%d, height=%d", x, y, self.width, self.height)
 
             flags = 0x0010  # SWP_NOACTIVATE
+            # Resize magnifier control first (its position inside the host
+            # never changes), so the host never shows it at the old size
+            if size_changed:
+                self.user32.SetWindowPos(
+                    self.hwnd_magnifier,
+                    None,
+                    0, 0,
+                    self.width, self.height,
+                    flags | 0x0002 | 0x0004  # SWP_NOMOVE | SWP_NOZORDER
+                )
             # Move host window
+            if show:
+                flags |= 0x0040  # SWP_SHOWWINDOW
             self.user32.SetWindowPos(
                 self.hwnd_host,
                 -1,  # HWND_TOPMOST
                 x, y, self.width, self.height,
                 flags
             )
-            # Resize magnifier control
-            self.user32.SetWindowPos(
-                self.hwnd_magnifier,
-                None,
-                0, 0,
-                self.width, self.height,
-                flags
-            )
             # Force repaint
             self.user32.UpdateWindow(self.hwnd_host)
 
+            self._last_geometry = geometry
+
         except Exception as e:
-            logger.error(f"Error updating window position: {e}")
+            logger.error("Error updating window position: %s", e)
 
-    def _update_content(self):
-        """Update the magnified content."""
-        if not self.hwnd_magnifier or not self.magnification or not self.user32:
-            return
+    def _apply_pending_changes(self):
+        """
+        Apply setting changes made since the last refresh tick.
 
-        try:
-            # Get screen dimensions
-            screen_width = self.user32.GetSystemMetrics(0)  # SM_CXSCREEN
-            screen_height = self.user32.GetSystemMetrics(1)  # SM_CYSCREEN
+        Setters only record what changed, so a burst of updates (for example
+        while a slider is dragged) results in a single SetWindowPos,
+        SetWindowRgn and MagSetWindowTransform call here. Because this runs
+        from the refresh tick, the calls are also made on the thread that
+        owns the windows rather than on the caller's thread.
+        """
+        if self._geometry_dirty:
+            self._geometry_dirty = False
+            self._update_window_position()
 
-            # Calculate center point
-            center_x = (screen_width // 2) + self.x_offset
-            center_y = (screen_height // 2) + self.y_offset
+        if self._shape_dirty:
+            self._shape_dirty = False
+            if self.circular:
+                self._set_circular_region()
+            else:
+                # Reset to rectangular shape by removing the region
+                self.user32.SetWindowRgn(self.hwnd_host, None, True)
 
-            # Calculate source rectangle size
-            # Ensure zoom level is not zero to avoid division by zero
-            safe_zoom = max(1.0, self.zoom_level)
-            scaled_width = int(self.width / safe_zoom)
-            scaled_height = int(self.height / safe_zoom)
+        if self._transform_dirty:
+            self._transform_dirty = False
+            self._apply_transform()
 
-            # Calculate source rectangle bounds
-            left = center_x - scaled_width // 2
-            top = center_y - scaled_height // 2
-            right = left + scaled_width
-            bottom = top + scaled_height
+    def _apply_transform(self):
+        """Set the magnification transform for the current zoom level."""
+        # Apply zoom to the cached matrix
+        transform = self._transform
+        transform.v[0] = transform.v[4] = float(self.zoom_level)  # x and y scale
 
-            # Ensure bounds are within screen limits (optional, MagSetWindowSource might handle this)
-            left = max(0, min(left, screen_width - scaled_width))
-            top = max(0, min(top, screen_height - scaled_height))
-            right = left + scaled_width
-            bottom = top + scaled_height
+        # Set the transform
+        if not self.magnification.MagSetWindowTransform(self.hwnd_magnifier, byref(transform)):
+            logger.warning("Failed to set window transform on zoom. Error: %s", WinError())
+
+    def _update_content(self):
+        """Update the magnified content."""
+        if not self.hwnd_magnifier or not self.magnification or not self.user32:
+            return
 
+        try:
+            # Apply any coalesced setting changes first
+            self._apply_pending_changes()
 
-            source_rect = self.RECT(left, top, right, bottom)
+            # The source rectangle only changes with the settings or the
+            # (cached) screen size, so it is recomputed only then
+            source_key = (self.width, self.height, self.zoom_level, self.x_offset, self.y_offset,
+                          self.screen_width, self.screen_height)
+            if source_key != self._source_key:
+                self._update_source_rect(*source_key)
+                self._source_key = source_key
 
             # Set the source rectangle
-            if not self.magnification.MagSetWindowSource(self.hwnd_magnifier, source_rect):
+            if not self.magnification.MagSetWindowSource(self.hwnd_magnifier, self._source_rect):
                  # Log error non-intrusively, maybe the window is hidden
                  # logger.warning(f"Failed to set window source. Error: {WinError()}")
                  pass # Avoid spamming logs if window is hidden
 
-            # Force repaint (Needed?) Mag API might handle this.
-            # self.user32.InvalidateRect(self.hwnd_host, None, True) # Invalidate host
-            # self.user32.UpdateWindow(self.hwnd_host)
+            # The magnifier control only re-renders when invalidated. The
+            # control covers the whole host, so skip the background erase
+            # and repaint straight away.
+            self.user32.RedrawWindow(
+                self.hwnd_magnifier, None, None,
+                0x0001 | 0x0020 | 0x0100  # RDW_INVALIDATE | RDW_NOERASE | RDW_UPDATENOW
+            )
 
         except Exception as e:
-            logger.error(f"Error updating Windows magnifier content: {e}")
+            logger.error("Error updating Windows magnifier content: %s", e)
+
+    def _update_source_rect(self, width, height, zoom_level, x_offset, y_offset,
+                            screen_width, screen_height):
+        """
+        Recompute the magnified source rectangle in place.
+
+        Args:
+            width (int): Width of the magnifier window
+            height (int): Height of the magnifier window
+            zoom_level (float): Current zoom level
+            x_offset (int): Horizontal offset from screen center
+            y_offset (int): Vertical offset from screen center
+            screen_width (int): Width of the screen
+            screen_height (int): Height of the screen
+        """
+        # Calculate center point
+        center_x = (screen_width // 2) + x_offset
+        center_y = (screen_height // 2) + y_offset
+
+        # Calculate source rectangle size
+        # Ensure zoom level is not zero to avoid division by zero
+        safe_zoom = max(1.0, zoom_level)
+        scaled_width = int(width / safe_zoom)
+        scaled_height = int(height / safe_zoom)
+
+        # Calculate source rectangle bounds
+        left = center_x - scaled_width // 2
+        top = center_y - scaled_height // 2
+
+        # Ensure bounds are within screen limits (optional, MagSetWindowSource might handle this)
+        left = max(0, min(left, screen_width - scaled_width))
+        top = max(0, min(top, screen_height - scaled_height))
+
+        rect = self._source_rect
+        rect.left = left
+        rect.top = top
+        rect.right = left + scaled_width
+        rect.bottom = top + scaled_height
 
     def set_window_size(self, width, height):
         """
@@ -778,16 +1558,9 @@ class WindowsMagnifier:
         self.height = height
 
         if self.hwnd_host and self.initialized:
-            # Update window position and size
-            self._update_window_position()
-
-            # Update window shape if circular
-            if self.circular:
-                self._set_circular_region()
-            else:
-                # Ensure rectangular shape if not circular
-                 self.user32.SetWindowRgn(self.hwnd_host, None, True)
-
+            # Update window position, size and shape on the next tick
+            self._geometry_dirty = True
+            self._shape_dirty = True
 
     def set_window_shape(self, circular):
         """
@@ -799,11 +1572,8 @@ class WindowsMagnifier:
         self.circular = circular
 
         if self.hwnd_host and self.initialized:
-            if circular:
-                self._set_circular_region()
-            else:
-                # Reset to rectangular shape by removing the region
-                self.user32.SetWindowRgn(self.hwnd_host, None, True)
+            # Update the window region on the next tick
+            self._shape_dirty = True
 
     def set_refresh_rate(self, refresh_rate):
         """
@@ -812,16 +1582,9 @@ class WindowsMagnifier:
         Args:
             refresh_rate (int): Frames per second (1-144)
         """
+        # The frame pacer picks up the new rate on its next tick
         self.refresh_rate = max(1, min(144, refresh_rate))
 
-        if self.hwnd_host and self.initialized:
-            # Update timer
-            self.user32.KillTimer(self.hwnd_host, self.timer_id)
-            interval = int(1000 / self.refresh_rate)
-            if not self.user32.SetTimer(self.hwnd_host, self.timer_id, interval, self.wnd_proc):
-                logger.error(f"Failed to reset timer. Error code: {WinError()}")
-
-
     def set_zoom_level(self, zoom_level):
         """
         Set the zoom level for magnification.
@@ -832,20 +1595,8 @@ class WindowsMagnifier:
         self.zoom_level = max(1.0, zoom_level)
 
         if self.hwnd_magnifier and self.initialized:
-            # Create identity matrix
-            transform = self.MAGTRANSFORM()
-            # Identity matrix setup
-            transform.v[0] = 0.0; transform.v[1] = 0.0; transform.v[2] = 0.0
-            transform.v[3] = 0.0; transform.v[4] = 0.0; transform.v[5] = 0.0
-            transform.v[6] = 0.0; transform.v[7] = 0.0; transform.v[8] = 0.0
-            # Apply zoom
-            transform.v[0] = float(self.zoom_level)  # x scale
-            transform.v[4] = float(self.zoom_level)  # y scale
-            transform.v[8] = 1.0                     # w scale
-
-            # Set the transform
-            if not self.magnification.MagSetWindowTransform(self.hwnd_magnifier, byref(transform)):
-                logger.warning(f"Failed to set window transform on zoom. Error: {WinError()}")
+            # Update the transform on the next tick
+            self._transform_dirty = True
 
 
     def move_window(self, x_offset, y_offset):
@@ -860,7 +1611,8 @@ class WindowsMagnifier:
         self.y_offset = y_offset
 
         if self.hwnd_host and self.initialized:
-            self._update_window_position()
+            # Move the window on the next tick
+            self._geometry_dirty = True
 
     def show_window(self):
         """Show the magnifier window."""
@@ -869,40 +1621,30 @@ class WindowsMagnifier:
         if not self.hwnd_host or not self.user32 or not self.initialized:
             logger.warning("Cannot show window - missing handles or not initialized")
             return
+
+        if self.visible:
+            # Already shown and updating; setting changes reach the window
+            # through the refresh tick
+            return
+        self.visible = True
     
-        # Update position before showing
-        self._update_window_position()
-    
-        # Make a small pause to ensure position is applied
-        import time
-        time.sleep(0.05)
-    
-        # Show window with flag SW_SHOWNA (8) - show without activation
-        result = self.user32.ShowWindow(self.hwnd_host, 8)
-        logger.info(f"ShowWindow show result: {result}")
-    
-        # CRITICAL: Recreate the timer for updates
-        interval = int(1000 / self.refresh_rate)
-        timer_result = self.user32.SetTimer(self.hwnd_host, self.timer_id, interval, self.wnd_proc)
-        logger.info(f"Timer recreation result: {timer_result}")
-    
-        if not timer_result:
-            logger.error(f"Failed to recreate timer: {WinError()}")
+        # Apply pending shape changes and reset the transform to ensure it's
+        # properly applied; the geometry is applied by the show below
+        self._geometry_dirty = False
+        self._transform_dirty = True
+        self._apply_pending_changes()
     
-        # Reset the transform to ensure it's properly applied
-        transform = self.MAGTRANSFORM()
-        transform.v[0] = float(self.zoom_level)  # x scale
-        transform.v[4] = float(self.zoom_level)  # y scale
-        transform.v[8] = 1.0  # Additional scale factor
+        # Position, re-assert the topmost z-order and show without activation
+        # in a single synchronous SetWindowPos, so the window never appears
+        # at a stale position
+        self._update_window_position(force=True, show=True)
     
-        self.magnification.MagSetWindowTransform(self.hwnd_magnifier, byref(transform))
+        # CRITICAL: Restart the frame pacer for updates
+        self._start_pacer()
     
         # Update content immediately
         self._update_content()
     
-        # Update position again after showing
-        self._update_window_position()
-    
         logger.info("Windows Magnifier window shown and updates enabled")
 
     def hide_window(self):
@@ -912,40 +1654,25 @@ class WindowsMagnifier:
         if not self.hwnd_host or not self.user32 or not self.initialized:
             logger.warning("Cannot hide window - missing handles or not initialized")
             return
+
+        if not self.visible:
+            return
+        self.visible = False
         
-        # First kill the timer to stop updates
+        # First stop the frame pacer to stop updates
         try:
-            result = self.user32.KillTimer(self.hwnd_host, self.timer_id)
-            logger.info(f"Killed timer: {result}")
+            self._stop_pacer()
         except Exception as e:
-            logger.error(f"Error killing timer: {e}")
+            logger.error("Error stopping frame pacer: %s", e)
     
-        # Try to hide the window
+        # Hide the window. ShowWindow is synchronous and returns whether the
+        # window was previously visible, so there is nothing left to verify.
         try:
             # SW_HIDE = 0
-            result = self.user32.ShowWindow(self.hwnd_host, 0)
-            logger.info(f"ShowWindow hide result: {result}")
-        
-            # Additional force-hide attempt
-            if not result:
-                # Try with different flags
-                result = self.user32.SetWindowPos(
-                    self.hwnd_host,
-                    0,  # HWND_TOP
-                    0, 0, 0, 0,
-                    0x0080 | 0x0400  # SWP_HIDEWINDOW | SWP_NOMOVE
-                )
-                logger.info(f"SetWindowPos hide result: {result}")
-            
-            # Check if window is actually hidden
-            style = self.user32.GetWindowLongW(self.hwnd_host, -16)  # GWL_STYLE
-            is_visible = (style & 0x10000000) != 0  # WS_VISIBLE
-            logger.info(f"Window visible state after hide: {is_visible}")
-        
-            if is_visible:
-                logger.warning("Window is still visible after hide attempt")
+            if not self.user32.ShowWindow(self.hwnd_host, 0):
+                logger.debug("Window was already hidden")
         except Exception as e:
-            logger.error(f"Error hiding window: {e}")
+            logger.error("Error hiding window: %s", e)
         
         logger.info("Windows Magnifier hide_window completed")
 
@@ -957,25 +1684,34 @@ class WindowsMagnifier:
     def _cleanup_resources(self):
         """Clean up all Windows resources."""
         try:
-            # Kill timer
+            # Stop the frame pacer and release its handles
+            if self.kernel32:
+                self._stop_pacer()
+                for handle in (self._frame_timer, self._stop_event):
+                    if handle:
+                        self.kernel32.CloseHandle(handle)
+            self._frame_timer = None
+            self._stop_event = None
+
+            # Destroy the host; DestroyWindow destroys the magnifier control
+            # with it, since it is a child window. The call is synchronous, so
+            # WM_NCDESTROY (which removes the subclass) has been handled when
+            # it returns and the window proc can be released below.
             if self.hwnd_host and self.user32:
-                self.user32.KillTimer(self.hwnd_host, self.timer_id)
-
-            # Destroy windows (Child first)
-            if self.hwnd_magnifier and self.user32:
-                self.user32.DestroyWindow(self.hwnd_magnifier)
-                self.hwnd_magnifier = None
-
-            if self.hwnd_host and self.user32:
-                self.user32.DestroyWindow(self.hwnd_host)
+                if not self.user32.DestroyWindow(self.hwnd_host) and self._original_wnd_proc:
+                    logger.warning("Failed to destroy host window. Error code: %s", WinError())
+                    WindowsMagnifier._retired_callbacks.append(self.wnd_proc)
                 self.hwnd_host = None
+            self.hwnd_magnifier = None
+            self._last_geometry = None
 
             # Uninitialize magnification API
             if self.initialized and self.magnification:
                 self.magnification.MagUninitialize()
 
             self.initialized = False
+            self.visible = False
             self.wnd_proc = None # Release reference
 
         except Exception as e:
-            logger.error(f"Error cleaning up Windows Magnification resources: {e}")
+            logger.error("Error cleaning up Windows Magnification resources: %s", e)
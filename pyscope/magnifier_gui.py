@@ -3,17 +3,18 @@ import os
 import json
 import logging
 import platform
-from PyQt5.QtCore import Qt, QSize, QTimer, QThread
-from PyQt5.QtGui import QFont, QColor, QIcon
+from PyQt5.QtCore import Qt, QSize, QTimer, QThread, QObject, QSignalBlocker, pyqtSignal
+from PyQt5.QtGui import QFont, QColor, QIcon, QIntValidator
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QSlider, QLineEdit, QCheckBox, QRadioButton, QButtonGroup,
-    QPushButton, QGridLayout, QGroupBox, QMessageBox, QStatusBar
+    QPushButton, QGridLayout, QGroupBox, QMessageBox, QStatusBar, QComboBox
 )
 from pynput import keyboard, mouse
 from pynput.keyboard import Key, KeyCode
 from pynput.mouse import Button
 
+from . import RESOURCES_DIR
 from .magnifier import Magnifier
 from .utils.overlay import OffsetOverlay
 from .utils.settings import Settings
@@ -21,6 +22,58 @@ from .utils.settings import Settings
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Lookup table for key names stored in the settings file: every Key member by
+# its lowercase name plus the friendlier aliases shown in the UI.
+_KEY_BY_NAME = {name.lower(): key for name, key in Key.__members__.items()}
+_KEY_BY_NAME.update({
+    "return": Key.enter,
+    "escape": Key.esc,
+    "page up": Key.page_up,
+    "page down": Key.page_down,
+    "control": Key.ctrl,
+})
+
+# Stylesheet for the whole settings window, applied once on the main window
+_APP_QSS = """
+* { background-color: #2b2b2b; }
+QLabel, QRadioButton { color: white; }
+QLabel#title { font-size: 20px; font-weight: bold; }
+QLabel#tip { color: #aaaaaa; font-size: 16px; }
+QLabel#warning { color: #ff7777; font-size: 14px; font-weight: bold; }
+QStatusBar { color: #aaaaaa; }
+QGroupBox { color: white; border: 1px solid gray; margin-top: 1ex; }
+QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top center; padding: 0 3px; }
+QLineEdit, QComboBox { background-color: #3d3d3d; color: white; padding: 5px; }
+QPushButton { background-color: #3d3d3d; color: white; padding: 8px 16px; }
+QSlider::groove:horizontal { background: #555555; height: 8px; border-radius: 4px; }
+QSlider::handle:horizontal { background: #888888; width: 18px; margin: -5px 0; border-radius: 9px; }
+QCheckBox::indicator { width: 15px; height: 15px; }
+QCheckBox::indicator:unchecked { background-color: #3d3d3d; border: 1px solid gray; }
+QCheckBox::indicator:checked { background-color: #4d8bf0; border: 1px solid gray; }
+"""
+
+
+class _SliderValidator(QIntValidator):
+    """Integer validator that restores the slider's value on incomplete input."""
+    
+    def __init__(self, slider, parent=None):
+        super().__init__(slider.minimum(), slider.maximum(), parent)
+        self.slider = slider
+    
+    def fixup(self, text):
+        # Called by QLineEdit on Return or focus loss when the text is not
+        # acceptable (e.g. "5" for a 100-2000 range), so the edit never keeps
+        # showing a value the slider and Apply ignore
+        return str(self.slider.value())
+
+
+class _HotkeyBridge(QObject):
+    """Carries pynput events from the listener threads to the GUI thread."""
+    
+    key_event = pyqtSignal(object, bool)
+    mouse_event = pyqtSignal(object, bool)
+
+
 class MagnifierGUI(QMainWindow):
     """GUI for controlling the PyScope screen magnifier."""
     
@@ -49,8 +102,19 @@ class MagnifierGUI(QMainWindow):
         
         # Internal state
         self.window_visible = False
+        self._pending_visible = None
+        self._held_inputs = set()
+        self._toggle_timer = QTimer(self)
+        self._toggle_timer.setSingleShot(True)
+        self._toggle_timer.setInterval(16)
+        self._toggle_timer.timeout.connect(self._apply_pending_visibility)
+        # A release missed while another window had focus would otherwise leave
+        # its key marked as held and swallow every later press of it
+        QApplication.instance().applicationStateChanged.connect(self._reset_held_inputs)
         self.offset_overlay = None
         self.settings = Settings()
+        self._sized = False
+        self._applied = {}
         
         # Initialize UI
         self.init_ui()
@@ -62,7 +126,7 @@ class MagnifierGUI(QMainWindow):
         
         # Set window properties
         self.setWindowFlags(Qt.WindowStaysOnTopHint)
-        self.setStyleSheet("background-color: #2b2b2b;")
+        self.setStyleSheet(_APP_QSS)
         
         # Display status message about the magnifier mode
         self.update_status_message()
@@ -88,9 +152,9 @@ class MagnifierGUI(QMainWindow):
         self.setWindowTitle("PyScope Settings")
         
         # Try to load icon if available
-        icon_path = os.path.join(os.path.dirname(__file__), 'resources', 'icon.png')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        icon_path = RESOURCES_DIR / 'icon.png'
+        if icon_path.exists():
+            self.setWindowIcon(QIcon(str(icon_path)))
         
         # Create main widget and layout
         main_widget = QWidget()
@@ -105,16 +169,16 @@ class MagnifierGUI(QMainWindow):
         header_layout.setContentsMargins(0, 0, 0, 0)
         
         title_label = QLabel("PyScope")
-        title_label.setStyleSheet("color: white; font-size: 20px; font-weight: bold;")
+        title_label.setObjectName("title")
         title_label.setAlignment(Qt.AlignCenter)
         
         tip_label = QLabel("Toggle this menu (INSERT)")
-        tip_label.setStyleSheet("color: #aaaaaa; font-size: 16px;")
+        tip_label.setObjectName("tip")
         tip_label.setAlignment(Qt.AlignCenter)
         
         # Add warning for fullscreen mode
         warning_label = QLabel("⚠️ FULLSCREEN NOT SUPPORTED ⚠️")
-        warning_label.setStyleSheet("color: #ff7777; font-size: 14px; font-weight: bold;")
+        warning_label.setObjectName("warning")
         warning_label.setAlignment(Qt.AlignCenter)
         
         header_layout.addWidget(title_label)
@@ -149,15 +213,12 @@ class MagnifierGUI(QMainWindow):
         button_layout.setContentsMargins(0, 0, 0, 0)
         
         apply_button = QPushButton("Apply Settings")
-        apply_button.setStyleSheet("background-color: #3d3d3d; color: white; padding: 8px 16px;")
         apply_button.clicked.connect(self.on_apply_settings)
         
         reset_button = QPushButton("Reset Defaults")
-        reset_button.setStyleSheet("background-color: #3d3d3d; color: white; padding: 8px 16px;")
         reset_button.clicked.connect(self.on_reset_defaults)
         
         exit_button = QPushButton("Exit")
-        exit_button.setStyleSheet("background-color: #3d3d3d; color: white; padding: 8px 16px;")
         exit_button.clicked.connect(self.on_exit)
         
         button_layout.addWidget(apply_button)
@@ -168,18 +229,14 @@ class MagnifierGUI(QMainWindow):
         
         # Add status bar
         self.status_bar = QStatusBar()
-        self.status_bar.setStyleSheet("color: #aaaaaa;")
         main_layout.addWidget(self.status_bar)
         
-        # Set size
+        # Set size (fixed on first show, once the layout has been resolved)
         self.setMinimumWidth(430)
-        self.setFixedSize(self.sizeHint())
     
     def create_api_mode_group(self, parent_layout):
         """Create a group to display the API mode (Windows only)."""
         api_group = QGroupBox("Magnification Engine")
-        api_group.setStyleSheet("QGroupBox { color: white; border: 1px solid gray; margin-top: 1ex; } "
-                                "QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top center; padding: 0 3px; }")
         api_layout = QVBoxLayout(api_group)
         
         # Create label to display the API mode
@@ -205,25 +262,19 @@ class MagnifierGUI(QMainWindow):
     def create_hotkey_group(self, parent_layout):
         """Create hotkey settings group."""
         hotkey_group = QGroupBox("Hotkey (Toggle/Hold)")
-        hotkey_group.setStyleSheet("QGroupBox { color: white; border: 1px solid gray; margin-top: 1ex; } "
-                                 "QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top center; padding: 0 3px; }")
         hotkey_layout = QGridLayout(hotkey_group)
         
         # Hotkey input
         hotkey_label = QLabel("Press a key:")
-        hotkey_label.setStyleSheet("color: white;")
         self.hotkey_input = QLineEdit("X")
         self.hotkey_input.setReadOnly(True)
-        self.hotkey_input.setStyleSheet("background-color: #3d3d3d; color: white; padding: 5px;")
         self.hotkey_input.mousePressEvent = self.on_hotkey_input_click
         
         # Radio buttons for toggle/hold
         self.toggle_radio = QRadioButton("Toggle")
-        self.toggle_radio.setStyleSheet("color: white;")
         self.toggle_radio.setChecked(True)
         
         self.hold_radio = QRadioButton("Hold")
-        self.hold_radio.setStyleSheet("color: white;")
         
         # Add to layout
         hotkey_layout.addWidget(hotkey_label, 0, 0)
@@ -236,99 +287,53 @@ class MagnifierGUI(QMainWindow):
     def create_window_settings_group(self, parent_layout):
         """Create window settings group."""
         settings_group = QGroupBox("Window Settings")
-        settings_group.setStyleSheet("QGroupBox { color: white; border: 1px solid gray; margin-top: 1ex; } "
-                                   "QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top center; padding: 0 3px; }")
         settings_layout = QGridLayout(settings_group)
         
         # Width setting
         width_label = QLabel("Width:")
-        width_label.setStyleSheet("color: white;")
-        
-        self.width_input = QLineEdit("400")
-        self.width_input.setStyleSheet("background-color: #3d3d3d; color: white; padding: 5px;")
         
-        self.width_slider = QSlider(Qt.Horizontal)
-        self.width_slider.setRange(100, 2000)
-        self.width_slider.setValue(400)
-        self.width_slider.setStyleSheet("QSlider::groove:horizontal { background: #555555; height: 8px; border-radius: 4px; }"
-                                       "QSlider::handle:horizontal { background: #888888; width: 18px; margin: -5px 0; border-radius: 9px; }")
-        self.width_slider.valueChanged.connect(lambda v: self.width_input.setText(str(v)))
+        self.width_input, self.width_slider = self._make_slider_row(100, 2000, 400)
         
         # Height setting
         height_label = QLabel("Height:")
-        height_label.setStyleSheet("color: white;")
         
-        self.height_input = QLineEdit("400")
-        self.height_input.setStyleSheet("background-color: #3d3d3d; color: white; padding: 5px;")
-        
-        self.height_slider = QSlider(Qt.Horizontal)
-        self.height_slider.setRange(100, 2000)
-        self.height_slider.setValue(400)
-        self.height_slider.setStyleSheet("QSlider::groove:horizontal { background: #555555; height: 8px; border-radius: 4px; }"
-                                        "QSlider::handle:horizontal { background: #888888; width: 18px; margin: -5px 0; border-radius: 9px; }")
-        self.height_slider.valueChanged.connect(lambda v: self.height_input.setText(str(v)))
+        self.height_input, self.height_slider = self._make_slider_row(100, 2000, 400)
         
         # Circular shape
         circular_label = QLabel("Circular Shape:")
-        circular_label.setStyleSheet("color: white;")
         
         self.circular_checkbox = QCheckBox()
         self.circular_checkbox.setChecked(True)
-        self.circular_checkbox.setStyleSheet("QCheckBox::indicator { width: 15px; height: 15px; }"
-                                           "QCheckBox::indicator:unchecked { background-color: #3d3d3d; border: 1px solid gray; }"
-                                           "QCheckBox::indicator:checked { background-color: #4d8bf0; border: 1px solid gray; }")
         
         # Display offset
         offset_display_label = QLabel("Display Offset:")
-        offset_display_label.setStyleSheet("color: white;")
         
         self.offset_display_checkbox = QCheckBox()
         self.offset_display_checkbox.setChecked(False)
-        self.offset_display_checkbox.setStyleSheet("QCheckBox::indicator { width: 15px; height: 15px; }"
-                                                 "QCheckBox::indicator:unchecked { background-color: #3d3d3d; border: 1px solid gray; }"
-                                                 "QCheckBox::indicator:checked { background-color: #4d8bf0; border: 1px solid gray; }")
         
         # Refresh rate setting
         refresh_label = QLabel("Refresh Rate (FPS):")
-        refresh_label.setStyleSheet("color: white;")
-        
-        self.refresh_input = QLineEdit("60")
-        self.refresh_input.setStyleSheet("background-color: #3d3d3d; color: white; padding: 5px;")
         
-        self.refresh_slider = QSlider(Qt.Horizontal)
-        self.refresh_slider.setRange(1, 144)
-        self.refresh_slider.setValue(60)
-        self.refresh_slider.setStyleSheet("QSlider::groove:horizontal { background: #555555; height: 8px; border-radius: 4px; }"
-                                        "QSlider::handle:horizontal { background: #888888; width: 18px; margin: -5px 0; border-radius: 9px; }")
-        self.refresh_slider.valueChanged.connect(lambda v: self.refresh_input.setText(str(v)))
+        self.refresh_input, self.refresh_slider = self._make_slider_row(1, 144, 60)
         
         # X offset setting
         x_offset_label = QLabel("Offset X:")
-        x_offset_label.setStyleSheet("color: white;")
-        
-        self.x_offset_input = QLineEdit("0")
-        self.x_offset_input.setStyleSheet("background-color: #3d3d3d; color: white; padding: 5px;")
         
-        self.x_offset_slider = QSlider(Qt.Horizontal)
-        self.x_offset_slider.setRange(-200, 200)  # Increased range from -100,100
-        self.x_offset_slider.setValue(0)
-        self.x_offset_slider.setStyleSheet("QSlider::groove:horizontal { background: #555555; height: 8px; border-radius: 4px; }"
-                                         "QSlider::handle:horizontal { background: #888888; width: 18px; margin: -5px 0; border-radius: 9px; }")
-        self.x_offset_slider.valueChanged.connect(lambda v: self.x_offset_input.setText(str(v)))
+        self.x_offset_input, self.x_offset_slider = self._make_slider_row(-200, 200, 0)  # Increased range from -100,100
         
         # Y offset setting
         y_offset_label = QLabel("Offset Y:")
-        y_offset_label.setStyleSheet("color: white;")
         
-        self.y_offset_input = QLineEdit("0")
-        self.y_offset_input.setStyleSheet("background-color: #3d3d3d; color: white; padding: 5px;")
+        self.y_offset_input, self.y_offset_slider = self._make_slider_row(-200, 200, 0)  # Increased range from -100,100
         
-        self.y_offset_slider = QSlider(Qt.Horizontal)
-        self.y_offset_slider.setRange(-200, 200)  # Increased range from -100,100
-        self.y_offset_slider.setValue(0)
-        self.y_offset_slider.setStyleSheet("QSlider::groove:horizontal { background: #555555; height: 8px; border-radius: 4px; }"
-                                         "QSlider::handle:horizontal { background: #888888; width: 18px; margin: -5px 0; border-radius: 9px; }")
-        self.y_offset_slider.valueChanged.connect(lambda v: self.y_offset_input.setText(str(v)))
+        # Resampling quality (used at fractional zoom levels)
+        quality_label = QLabel("Scaling Quality:")
+        
+        self.quality_combo = QComboBox()
+        self.quality_combo.addItem("Fast (bilinear)", "fast")
+        self.quality_combo.addItem("Balanced (bicubic)", "balanced")
+        self.quality_combo.addItem("Best (Lanczos)", "best")
+        self.quality_combo.setCurrentIndex(1)
         
         # Add to layout
         settings_layout.addWidget(width_label, 0, 0)
@@ -357,37 +362,64 @@ class MagnifierGUI(QMainWindow):
         settings_layout.addWidget(self.y_offset_input, 6, 1)
         settings_layout.addWidget(self.y_offset_slider, 6, 2)
         
+        settings_layout.addWidget(quality_label, 7, 0)
+        settings_layout.addWidget(self.quality_combo, 7, 1, 1, 2)
+        
         parent_layout.addWidget(settings_group)
     
+    def _make_slider_row(self, lo, hi, default):
+        """
+        Create a line edit and a horizontal slider bound to the same value.
+        
+        Args:
+            lo (int): Minimum slider value
+            hi (int): Maximum slider value
+            default (int): Initial value
+            
+        Returns:
+            tuple: (QLineEdit, QSlider)
+        """
+        edit = QLineEdit(str(default))
+        slider = QSlider(Qt.Horizontal)
+        slider.setRange(lo, hi)
+        slider.setValue(default)
+        edit.setValidator(_SliderValidator(slider, edit))
+        slider.valueChanged.connect(lambda v: edit.setText(str(v)))
+        
+        def commit_edit():
+            # The validator is locale-aware, so "1,000" is acceptable input
+            value, ok = edit.locale().toInt(edit.text())
+            if ok:
+                # The slider holds the authoritative value
+                blocker = QSignalBlocker(slider)
+                slider.setValue(value)
+                blocker.unblock()
+            edit.setText(str(slider.value()))
+        
+        edit.editingFinished.connect(commit_edit)
+        return edit, slider
+    
     def create_zoom_settings_group(self, parent_layout):
         """Create zoom settings group."""
         zoom_group = QGroupBox("Zoom Multiplier Settings")
-        zoom_group.setStyleSheet("QGroupBox { color: white; border: 1px solid gray; margin-top: 1ex; } "
-                               "QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top center; padding: 0 3px; }")
         zoom_layout = QGridLayout(zoom_group)
         
         # Zoom hotkey
         zoom_hotkey_label = QLabel("Hotkey:")
-        zoom_hotkey_label.setStyleSheet("color: white;")
         
         self.zoom_hotkey_input = QLineEdit("Z")
         self.zoom_hotkey_input.setReadOnly(True)
-        self.zoom_hotkey_input.setStyleSheet("background-color: #3d3d3d; color: white; padding: 5px;")
         self.zoom_hotkey_input.mousePressEvent = self.on_zoom_hotkey_input_click
         
         # Zoom low setting
         zoom_low_label = QLabel("Zoom value 1:")
-        zoom_low_label.setStyleSheet("color: white;")
         
         self.zoom_low_input = QLineEdit("2.0")
-        self.zoom_low_input.setStyleSheet("background-color: #3d3d3d; color: white; padding: 5px;")
         
         # Zoom high setting
         zoom_high_label = QLabel("Zoom value 2:")
-        zoom_high_label.setStyleSheet("color: white;")
         
         self.zoom_high_input = QLineEdit("4.0")
-        self.zoom_high_input.setStyleSheet("background-color: #3d3d3d; color: white; padding: 5px;")
         
         # Add to layout
         zoom_layout.addWidget(zoom_hotkey_label, 0, 0)
@@ -442,6 +474,8 @@ class MagnifierGUI(QMainWindow):
             self.refresh_input.setText(str(default_settings["refresh_rate"]))
             self.refresh_slider.setValue(default_settings["refresh_rate"])
             
+            self.set_quality_selection(default_settings["quality"])
+            
             self.x_offset_input.setText(str(default_settings["x_offset"]))
             self.x_offset_slider.setValue(default_settings["x_offset"])
             
@@ -496,12 +530,13 @@ class MagnifierGUI(QMainWindow):
         """Save settings to file."""
         try:
             settings = {
-                "width": int(self.width_input.text()),
-                "height": int(self.height_input.text()),
+                "width": self.width_slider.value(),
+                "height": self.height_slider.value(),
                 "circular": self.circular_checkbox.isChecked(),
-                "refresh_rate": int(self.refresh_input.text()),
-                "x_offset": int(self.x_offset_input.text()),
-                "y_offset": int(self.y_offset_input.text()),
+                "refresh_rate": self.refresh_slider.value(),
+                "quality": self.quality_combo.currentData(),
+                "x_offset": self.x_offset_slider.value(),
+                "y_offset": self.y_offset_slider.value(),
                 "toggle_mode": self.toggle_radio.isChecked(),
                 "hotkey_text": self.hotkey_input.text(),
                 "hotkey_is_mouse": self.hotkey_is_mouse,
@@ -546,6 +581,8 @@ class MagnifierGUI(QMainWindow):
             self.refresh_input.setText(str(settings.get("refresh_rate", 60)))
             self.refresh_slider.setValue(int(settings.get("refresh_rate", 60)))
             
+            self.set_quality_selection(settings.get("quality", "balanced"))
+            
             self.x_offset_input.setText(str(settings.get("x_offset", 0)))
             self.x_offset_slider.setValue(int(settings.get("x_offset", 0)))
             
@@ -600,6 +637,16 @@ class MagnifierGUI(QMainWindow):
                 QMessageBox.Ok
             )
     
+    def set_quality_selection(self, quality):
+        """
+        Select a scaling quality in the quality combo box.
+        
+        Args:
+            quality (str): Quality value ("fast", "balanced" or "best")
+        """
+        index = self.quality_combo.findData(quality)
+        self.quality_combo.setCurrentIndex(index if index >= 0 else 1)
+    
     def key_from_string(self, key_str):
         """
         Convert a key string to a pynput.keyboard.Key or KeyCode.
@@ -610,58 +657,14 @@ class MagnifierGUI(QMainWindow):
         Returns:
             Key or KeyCode: The key object
         """
-        # Handle special keys
-        if key_str.lower() == "insert":
-            return Key.insert
-            
-        # Dictionary of common key mappings
-        key_map = {
-            "space": Key.space,
-            "tab": Key.tab,
-            "enter": Key.enter,
-            "return": Key.enter,
-            "backspace": Key.backspace,
-            "delete": Key.delete,
-            "esc": Key.esc,
-            "escape": Key.esc,
-            "up": Key.up,
-            "down": Key.down,
-            "left": Key.left,
-            "right": Key.right,
-            "home": Key.home,
-            "end": Key.end,
-            "page up": Key.page_up,
-            "page down": Key.page_down,
-            "shift": Key.shift,
-            "ctrl": Key.ctrl,
-            "control": Key.ctrl,
-            "alt": Key.alt,
-            "f1": Key.f1,
-            "f2": Key.f2,
-            "f3": Key.f3,
-            "f4": Key.f4,
-            "f5": Key.f5,
-            "f6": Key.f6,
-            "f7": Key.f7,
-            "f8": Key.f8,
-            "f9": Key.f9,
-            "f10": Key.f10,
-            "f11": Key.f11,
-            "f12": Key.f12
-        }
-        
-        # Check key map
-        if key_str.lower() in key_map:
-            return key_map[key_str.lower()]
-        
-        # Check direct key attributes
-        for key in vars(Key):
-            if not key.startswith('_') and key_str.lower() == key:
-                return getattr(Key, key)
+        name = key_str.lower()
+        key = _KEY_BY_NAME.get(name)
+        if key is not None:
+            return key
         
         # Single character keys
         if len(key_str) == 1:
-            return KeyCode.from_char(key_str.lower())
+            return KeyCode.from_char(name)
         
         # Default
         logger.warning(f"Unknown key '{key_str}', defaulting to 'x'")
@@ -671,25 +674,49 @@ class MagnifierGUI(QMainWindow):
         """Apply current settings to the magnifier."""
         try:
             # Get values from inputs
-            width = int(self.width_input.text())
-            height = int(self.height_input.text())
-            refresh_rate = int(self.refresh_input.text())
-            x_offset = int(self.x_offset_input.text())
-            y_offset = int(self.y_offset_input.text())
+            width = self.width_slider.value()
+            height = self.height_slider.value()
+            refresh_rate = self.refresh_slider.value()
+            quality = self.quality_combo.currentData()
+            x_offset = self.x_offset_slider.value()
+            y_offset = self.y_offset_slider.value()
             circular = self.circular_checkbox.isChecked()
             display_offset = self.offset_display_checkbox.isChecked()
             zoom_low = float(self.zoom_low_input.text())
             zoom_high = float(self.zoom_high_input.text())
             
-            # Apply to magnifier
-            self.magnifier.set_resolution(width, height)
-            self.magnifier.set_window_shape(circular)
-            self.magnifier.set_refresh_rate(refresh_rate)
-            self.magnifier.move_window(x_offset, y_offset)
+            # Apply to magnifier, skipping setters whose inputs haven't changed
+            new = {
+                "wh": (width, height),
+                "shape": circular,
+                "fps": refresh_rate,
+                "quality": quality,
+                "pos": (x_offset, y_offset),
+                "zoom": (zoom_low, zoom_high),
+            }
+            applied = self._applied
+            
+            if applied.get("wh") != new["wh"]:
+                self.magnifier.set_resolution(width, height)
+                applied["wh"] = new["wh"]
+            if applied.get("shape") != new["shape"]:
+                self.magnifier.set_window_shape(circular)
+                applied["shape"] = new["shape"]
+            if applied.get("fps") != new["fps"]:
+                self.magnifier.set_refresh_rate(refresh_rate)
+                applied["fps"] = new["fps"]
+            if applied.get("quality") != new["quality"]:
+                self.magnifier.set_quality(quality)
+                applied["quality"] = new["quality"]
+            if applied.get("pos") != new["pos"]:
+                self.magnifier.move_window(x_offset, y_offset)
+                applied["pos"] = new["pos"]
             
             # Update zoom settings
-            self.magnifier.zoom_level_low = zoom_low
-            self.magnifier.zoom_level_high = zoom_high
+            if applied.get("zoom") != new["zoom"]:
+                self.magnifier.zoom_level_low = zoom_low
+                self.magnifier.zoom_level_high = zoom_high
+                applied["zoom"] = new["zoom"]
             
             # Update activation mode
             self.toggle_mode = self.toggle_radio.isChecked()
@@ -699,11 +726,14 @@ class MagnifierGUI(QMainWindow):
                 if self.magnifier.is_visible():
                     self.magnifier.hide_window()
                 
+                overlay_geometry = (width, height, x_offset, y_offset, circular)
                 if not self.offset_overlay:
                     from .utils.overlay import OffsetOverlay
-                    self.offset_overlay = OffsetOverlay(width, height, x_offset, y_offset, circular)
-                else:
-                    self.offset_overlay.update_settings(width, height, x_offset, y_offset, circular)
+                    self.offset_overlay = OffsetOverlay(*overlay_geometry)
+                    applied["overlay"] = overlay_geometry
+                elif applied.get("overlay") != overlay_geometry:
+                    self.offset_overlay.update_settings(*overlay_geometry)
+                    applied["overlay"] = overlay_geometry
                 
                 if self.window_visible:
                     self.offset_overlay.show()
@@ -734,77 +764,22 @@ class MagnifierGUI(QMainWindow):
     
     def setup_keyboard_listeners(self):
         """Setup keyboard and mouse event listeners for global hotkeys."""
+        # The pynput callbacks run on the OS input hook thread; they only
+        # forward the event so the hook never waits on Qt or the magnifier.
+        self._bridge = _HotkeyBridge()
+        self._bridge.key_event.connect(self._handle_key_event, Qt.QueuedConnection)
+        self._bridge.mouse_event.connect(self._handle_mouse_event, Qt.QueuedConnection)
+        # A new listener has not seen any presses yet
+        self._reset_held_inputs()
+        
         def on_key_press(key):
-            logger.info(f"Key pressed: {key}")
-            # Capture hotkey for settings
-            if self.hotkey_capture_active:
-                self.hotkey_is_mouse = False
-                self.hotkey = key
-                self.hotkey_input.setText(self.get_key_name(key))
-                self.hotkey_capture_active = False
-                return
-            
-            # Capture zoom hotkey
-            if self.zoom_hotkey_capture_active:
-                self.zoom_hotkey_is_mouse = False
-                self.zoom_hotkey = key
-                self.zoom_hotkey_input.setText(self.get_key_name(key))
-                self.zoom_hotkey_capture_active = False
-                return
-            
-            # Toggle settings window
-            if key == Key.insert:
-                self.setVisible(not self.isVisible())
-                return
-            
-            # Toggle magnifier (if not mouse hotkey)
-            if not self.hotkey_is_mouse and key == self.hotkey:
-                if self.toggle_mode:
-                    self.toggle_magnifier_visibility()
-                else:
-                    self.show_magnifier()
-            
-            # Toggle zoom preset (if not mouse hotkey)
-            if not self.zoom_hotkey_is_mouse and key == self.zoom_hotkey:
-                self.magnifier.toggle_zoom_preset()
+            self._bridge.key_event.emit(key, True)
         
         def on_key_release(key):
-            # Hold mode release
-            if not self.hotkey_is_mouse and not self.toggle_mode and key == self.hotkey:
-                self.hide_magnifier()
+            self._bridge.key_event.emit(key, False)
         
         def on_mouse_click(x, y, button, pressed):
-            if pressed:
-                # Capture hotkey
-                if self.hotkey_capture_active:
-                    self.hotkey_is_mouse = True
-                    self.hotkey_mouse_button = button
-                    self.hotkey_input.setText(self.get_button_name(button))
-                    self.hotkey_capture_active = False
-                    return
-                
-                # Capture zoom hotkey
-                if self.zoom_hotkey_capture_active:
-                    self.zoom_hotkey_is_mouse = True
-                    self.zoom_hotkey_mouse_button = button
-                    self.zoom_hotkey_input.setText(self.get_button_name(button))
-                    self.zoom_hotkey_capture_active = False
-                    return
-                
-                # Toggle magnifier (if mouse hotkey)
-                if self.hotkey_is_mouse and button == self.hotkey_mouse_button:
-                    if self.toggle_mode:
-                        self.toggle_magnifier_visibility()
-                    else:
-                        self.show_magnifier()
-                
-                # Toggle zoom preset (if mouse hotkey)
-                if self.zoom_hotkey_is_mouse and button == self.zoom_hotkey_mouse_button:
-                    self.magnifier.toggle_zoom_preset()
-            else:
-                # Hold mode release
-                if self.hotkey_is_mouse and not self.toggle_mode and button == self.hotkey_mouse_button:
-                    self.hide_magnifier()
+            self._bridge.mouse_event.emit(button, pressed)
         
         # Setup listeners
         try:
@@ -825,6 +800,104 @@ class MagnifierGUI(QMainWindow):
                 QMessageBox.Ok
             )
     
+    def _reset_held_inputs(self, *args):
+        """Forget which keys are held down, so no hotkey stays suppressed."""
+        self._held_inputs.clear()
+    
+    def _handle_key_event(self, key, pressed):
+        """
+        Dispatch a global keyboard event on the GUI thread.
+        
+        Args:
+            key: The key object from pynput
+            pressed: True for a press, False for a release
+        """
+        if not pressed:
+            self._held_inputs.discard(key)
+            # Hold mode release
+            if not self.hotkey_is_mouse and not self.toggle_mode and key == self.hotkey:
+                self.request_magnifier_visibility(False)
+            return
+        
+        # Ignore key autorepeat while the key is held down
+        if key in self._held_inputs:
+            return
+        self._held_inputs.add(key)
+        
+        logger.info(f"Key pressed: {key}")
+        # Capture hotkey for settings
+        if self.hotkey_capture_active:
+            self.hotkey_is_mouse = False
+            self.hotkey = key
+            self.hotkey_input.setText(self.get_key_name(key))
+            self.hotkey_capture_active = False
+            return
+        
+        # Capture zoom hotkey
+        if self.zoom_hotkey_capture_active:
+            self.zoom_hotkey_is_mouse = False
+            self.zoom_hotkey = key
+            self.zoom_hotkey_input.setText(self.get_key_name(key))
+            self.zoom_hotkey_capture_active = False
+            return
+        
+        # Toggle settings window
+        if key == Key.insert:
+            self.setVisible(not self.isVisible())
+            return
+        
+        # Toggle magnifier (if not mouse hotkey)
+        if not self.hotkey_is_mouse and key == self.hotkey:
+            if self.toggle_mode:
+                self.toggle_magnifier_visibility()
+            else:
+                self.request_magnifier_visibility(True)
+        
+        # Toggle zoom preset (if not mouse hotkey)
+        if not self.zoom_hotkey_is_mouse and key == self.zoom_hotkey:
+            self.magnifier.toggle_zoom_preset()
+    
+    def _handle_mouse_event(self, button, pressed):
+        """
+        Dispatch a global mouse click on the GUI thread.
+        
+        Args:
+            button: The button object from pynput
+            pressed: True for a press, False for a release
+        """
+        if not pressed:
+            # Hold mode release
+            if self.hotkey_is_mouse and not self.toggle_mode and button == self.hotkey_mouse_button:
+                self.request_magnifier_visibility(False)
+            return
+        
+        # Capture hotkey
+        if self.hotkey_capture_active:
+            self.hotkey_is_mouse = True
+            self.hotkey_mouse_button = button
+            self.hotkey_input.setText(self.get_button_name(button))
+            self.hotkey_capture_active = False
+            return
+        
+        # Capture zoom hotkey
+        if self.zoom_hotkey_capture_active:
+            self.zoom_hotkey_is_mouse = True
+            self.zoom_hotkey_mouse_button = button
+            self.zoom_hotkey_input.setText(self.get_button_name(button))
+            self.zoom_hotkey_capture_active = False
+            return
+        
+        # Toggle magnifier (if mouse hotkey)
+        if self.hotkey_is_mouse and button == self.hotkey_mouse_button:
+            if self.toggle_mode:
+                self.toggle_magnifier_visibility()
+            else:
+                self.request_magnifier_visibility(True)
+        
+        # Toggle zoom preset (if mouse hotkey)
+        if self.zoom_hotkey_is_mouse and button == self.zoom_hotkey_mouse_button:
+            self.magnifier.toggle_zoom_preset()
+    
     def get_key_name(self, key):
         """
         Get displayable name for a key.
@@ -870,10 +943,32 @@ class MagnifierGUI(QMainWindow):
     def toggle_magnifier_visibility(self):
         """Toggle the visibility of the magnifier."""
         previous_state = self.window_visible
-        self.window_visible = not self.window_visible
-        logger.info(f"Toggling magnifier visibility: {previous_state} -> {self.window_visible}")
+        if self._pending_visible is not None:
+            previous_state = self._pending_visible
+        logger.info(f"Toggling magnifier visibility: {previous_state} -> {not previous_state}")
+        self.request_magnifier_visibility(not previous_state)
+    
+    def request_magnifier_visibility(self, visible):
+        """
+        Schedule the magnifier to be shown or hidden.
+        
+        Requests arriving within the debounce interval are coalesced and only
+        the last one is applied, so hotkey bursts don't thrash the windows.
+        
+        Args:
+            visible: True to show the magnifier, False to hide it
+        """
+        self._pending_visible = visible
+        self._toggle_timer.start()
+    
+    def _apply_pending_visibility(self):
+        """Apply the last requested visibility state if it differs from the current one."""
+        visible = self._pending_visible
+        self._pending_visible = None
+        if visible is None or visible == self.window_visible:
+            return
         
-        if self.window_visible:
+        if visible:
             self.show_magnifier()
         else:
             self.hide_magnifier()
@@ -907,6 +1002,14 @@ class MagnifierGUI(QMainWindow):
                 logger.warning("Magnifier still marked as visible after hide_window call")
                 self.magnifier.visible = False
 
+    def showEvent(self, event):
+        """Handle window show event."""
+        super().showEvent(event)
+        if not self._sized:
+            # Lock the size Qt laid the window out at on its first show
+            self.setFixedSize(self.size())
+            self._sized = True
+    
     def closeEvent(self, event):
         """Handle window close event."""
         # Don't actually close, just hide the window
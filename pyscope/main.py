@@ -25,14 +25,15 @@ from PyQt5.QtCore import Qt, QTimer
 
 # Import local modules
 from pyscope.magnifier_gui import MagnifierGUI
-from pyscope import __version__
+from pyscope import (
+    __version__, APP_NAME, RESOURCES_DIR, USER_CONFIG_DIR,
+    ensure_resources_dir, ensure_user_config_dir
+)
 
 
 # Constants for the application
-APP_NAME = "PyScope"
-LOG_DIR = os.path.expanduser("~/.pyscope")
+LOG_DIR = USER_CONFIG_DIR
 CONFIG_DIR = LOG_DIR  # Using same directory for logs and config
-RESOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pyscope", "resources")
 
 
 def setup_logging(debug=False):
@@ -48,7 +49,7 @@ def setup_logging(debug=False):
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
     # Create logs directory if it doesn't exist
-    os.makedirs(LOG_DIR, exist_ok=True)
+    ensure_user_config_dir()
     
     # Set the default log level
     level = logging.DEBUG if debug else logging.INFO
@@ -59,7 +60,7 @@ def setup_logging(debug=False):
         format=log_format,
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler(os.path.join(LOG_DIR, "pyscope.log"))
+            logging.FileHandler(LOG_DIR / "pyscope.log")
         ]
     )
     
@@ -175,11 +176,10 @@ def initialize_app_environment():
     """
     try:
         # Create config directory if it doesn't exist
-        os.makedirs(CONFIG_DIR, exist_ok=True)
+        ensure_user_config_dir()
         
         # Create resources directory if it doesn't exist and it's not a packaged app
-        if not os.path.exists(RESOURCES_DIR) and not hasattr(sys, 'frozen'):
-            os.makedirs(RESOURCES_DIR, exist_ok=True)
+        ensure_resources_dir()
         
         # Set environment variables
         if platform.system() == "Windows":
@@ -206,10 +206,10 @@ def get_splash_screen():
     """
     try:
         # Try to find the splash image
-        splash_path = os.path.join(RESOURCES_DIR, "splash.png")
+        splash_path = RESOURCES_DIR / "splash.png"
         
-        if os.path.exists(splash_path):
-            pixmap = QPixmap(splash_path)
+        if splash_path.exists():
+            pixmap = QPixmap(str(splash_path))
             splash = QSplashScreen(pixmap, Qt.WindowStaysOnTopHint)
             splash.setWindowFlag(Qt.FramelessWindowHint)
             splash.showMessage(f"Starting {APP_NAME} v{__version__}", 
@@ -4,11 +4,12 @@ Settings management module for PyScope.
 This module provides functionality for loading, saving, and managing application settings.
 """
 
-import os
 import json
 import logging
 from pathlib import Path
 
+from .. import ensure_user_config_dir
+
 
 class Settings:
     """
@@ -23,21 +24,23 @@ class Settings:
         Initialize the settings manager.
         
         Args:
-            settings_dir (str, optional): Directory to store settings file.
+            settings_dir (str or Path, optional): Directory to store settings file.
                 If None, uses ~/.pyscope/ directory.
         """
         self.logger = logging.getLogger(__name__)
         
         # Determine settings directory and file
         if settings_dir is None:
-            self.settings_dir = os.path.expanduser("~/.pyscope")
+            self.settings_dir = ensure_user_config_dir()
         else:
-            self.settings_dir = settings_dir
-            
-        # Create directory if it doesn't exist
-        os.makedirs(self.settings_dir, exist_ok=True)
+            self.settings_dir = Path(settings_dir)
+            # Create directory if it doesn't exist
+            self.settings_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.settings_file = self.settings_dir / "settings.json"
         
-        self.settings_file = os.path.join(self.settings_dir, "settings.json")
+        # Hash of the last settings written, used to skip unchanged saves
+        self._last_settings_hash = None
         
         # Define default settings
         self.default_settings = {
@@ -45,6 +48,7 @@ class Settings:
             "height": 400,
             "circular": True,
             "refresh_rate": 60,
+            "quality": "balanced",
             "x_offset": 0,
             "y_offset": 0,
             "toggle_mode": True,
@@ -74,10 +78,18 @@ class Settings:
             merged_settings = self.default_settings.copy()
             merged_settings.update(settings)
             
+            # Skip the write if nothing changed since the last save
+            content = json.dumps(merged_settings, indent=2, sort_keys=True)
+            settings_hash = hash(content)
+            if settings_hash == self._last_settings_hash:
+                self.logger.debug("Settings unchanged, skipping save")
+                return True
+            
             # Save to file
             with open(self.settings_file, 'w') as f:
-                json.dump(merged_settings, f, indent=2)
-                
+                f.write(content)
+            
+            self._last_settings_hash = settings_hash
             self.logger.info(f"Settings saved to {self.settings_file}")
             return True
         
@@ -94,7 +106,7 @@ class Settings:
         """
         try:
             # Check if file exists
-            if not os.path.exists(self.settings_file):
+            if not self.settings_file.exists():
                 self.logger.info(f"Settings file not found at {self.settings_file}, using defaults")
                 return self.default_settings
             
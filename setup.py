@@ -45,6 +45,13 @@ dev_requirements = [
     'pyinstaller>=4.3',    # For creating standalone executables
 ]
 
+# Optional acceleration packages
+performance_requirements = [
+    'opencv-python-headless>=4.5.0',  # For faster resizing of captured frames
+    'dxcam>=0.0.5; sys_platform == "win32"',  # For DXGI Desktop Duplication capture
+    'xxhash>=2.0.0',         # For fast unchanged-frame detection
+]
+
 # Platform-specific requirements
 platform_requirements = {
     'win32': ['pywin32>=300'],     # Windows-specific functionality
@@ -121,10 +128,12 @@ setup(
     install_requires=base_requirements,
     extras_require={
         'dev': dev_requirements,
+        'performance': performance_requirements,
         'windows': platform_requirements['win32'],
         'linux': platform_requirements['linux'],
         'macos': platform_requirements['darwin'],
         'all': dev_requirements + 
+               performance_requirements +
                platform_requirements['win32'] + 
                platform_requirements['linux'] + 
                platform_requirements['darwin']